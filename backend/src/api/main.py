@@ -10,6 +10,7 @@ import uuid
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Dict, Any
 
+import orjson
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.exceptions import RequestValidationError
@@ -100,8 +101,17 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             # TODO: Clean up Redis connection pool
             logger.info("Cache connections closed")
             
-            # Close external service clients
-            # TODO: Clean up HTTP clients
+            # Close external service clients; imported here so app import
+            # doesn't load the service modules src.services loads lazily
+            from src.services.auth import close_auth_service
+            from src.services.github import close_github_service
+            from src.services.jira import close_jira_service
+            from src.services.http_client import close_http_client
+            
+            await close_auth_service()
+            await close_github_service()
+            await close_jira_service()
+            await close_http_client()
             logger.info("External service clients closed")
             
             logger.info("Application shutdown completed successfully")
@@ -126,7 +136,8 @@ def create_application() -> FastAPI:
     configure_logging(
         level=LogLevel(config.logging.level),
         json_format=config.logging.json_format,
-        enable_correlation_id=config.logging.enable_correlation_id
+        enable_correlation_id=config.logging.enable_correlation_id,
+        debug_stacks=config.debug
     )
     
     # Create FastAPI application
@@ -476,18 +487,20 @@ def register_routes(app: FastAPI) -> None:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
-    @app.get("/health/comprehensive")
-    async def comprehensive_health_check() -> Dict[str, Any]:
+    @app.get("/health/comprehensive", response_class=Response)
+    async def comprehensive_health_check() -> Response:
         """Comprehensive health check endpoint with detailed component status.
         
         This endpoint checks database connectivity, external services, and system metrics.
         Use this for detailed health monitoring and diagnostics.
         
         Returns:
-            Dictionary with detailed health status of all components
+            JSON response with detailed health status of all components
         """
         health_checker = get_health_check()
-        return await health_checker.comprehensive_health_check()
+        report = await health_checker.comprehensive_health_check()
+        # The report holds only plain JSON types, so orjson encodes it in one call
+        return Response(content=orjson.dumps(report), media_type="application/json")
     
     @app.get("/health/ready")
     async def readiness_probe() -> Dict[str, Any]:
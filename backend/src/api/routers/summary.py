@@ -6,18 +6,18 @@ This module provides RESTful endpoints for generating PR summaries
 with proper error handling, validation, and response formatting.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional
 import asyncio
 import logging
 from datetime import datetime
 
-from src.models.request import SummaryRequest
+from src.models.request import SummaryRequest, BulkSummaryRequest
 from src.models.pr_summary import PRSummary, ProcessingStatus
 from src.services.summary_service import SummaryOrchestrationService
-from src.services.github import GitHubService
-from src.services.jira import JiraService
+from src.services.github import get_github_service
+from src.services.jira import get_jira_service
 from src.services.gemini import GeminiService
 
 # Configure logging
@@ -33,13 +33,16 @@ router = APIRouter(
 # Global service instance (in production, use dependency injection)
 summary_service = None
 
+# Upper bound on PRs processed at once by the bulk endpoint
+BULK_MAX_CONCURRENCY = 8
+
 def get_summary_service() -> SummaryOrchestrationService:
     """Dependency injection for summary service."""
     global summary_service
     if summary_service is None:
         try:
-            github_service = GitHubService()
-            jira_service = JiraService()
+            github_service = get_github_service()
+            jira_service = get_jira_service()
             gemini_service = GeminiService()
             summary_service = SummaryOrchestrationService(
                 github_service=github_service,
@@ -67,6 +70,10 @@ def get_summary_service() -> SummaryOrchestrationService:
 )
 async def generate_summary(
     request: SummaryRequest,
+    regenerate: bool = Query(
+        False,
+        description="Generate a fresh summary instead of reusing a recent one for the same PR"
+    ),
     summary_service: SummaryOrchestrationService = Depends(get_summary_service)
 ) -> PRSummary:
     """
@@ -74,6 +81,7 @@ async def generate_summary(
     
     Args:
         request: Summary request containing GitHub PR URL and optional Jira ticket
+        regenerate: Skip the AI response cache
         summary_service: Injected summary orchestration service
         
     Returns:
@@ -86,7 +94,8 @@ async def generate_summary(
         logger.info(f"Generating summary for PR: {request.github_pr_url}")
         
         # Generate summary using orchestration service
-        summary = await summary_service.generate_summary(request)
+        options = {"cache": False} if regenerate else None
+        summary = await summary_service.generate_summary(request, options)
         
         logger.info(f"Summary generated successfully for PR: {request.github_pr_url}")
         return summary
@@ -189,6 +198,61 @@ async def generate_summary_async(
             }
         )
 
+@router.post(
+    "/generate-bulk",
+    response_model=Dict[str, Any],
+    status_code=200,
+    summary="Generate PR Summaries in Bulk",
+    description="Generate summaries for several pull requests concurrently"
+)
+async def generate_summaries_bulk(
+    request: BulkSummaryRequest,
+    summary_service: SummaryOrchestrationService = Depends(get_summary_service)
+) -> Dict[str, Any]:
+    """
+    Generate summaries for multiple PRs in one call.
+    
+    Failures are reported per PR, so one bad URL does not fail the batch.
+    
+    Args:
+        request: Bulk request with the PR summary requests to process
+        summary_service: Injected summary orchestration service
+        
+    Returns:
+        Per-PR results in request order
+    """
+    max_concurrency = BULK_MAX_CONCURRENCY if request.parallel_processing else 1
+    
+    logger.info(f"Generating {len(request.pr_requests)} summaries in bulk")
+    
+    outcomes = await summary_service.generate_summaries_batch(
+        request.pr_requests,
+        max_concurrency=max_concurrency
+    )
+    
+    results = []
+    for pr_request, outcome in zip(request.pr_requests, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Bulk summary failed for {pr_request.github_pr_url}: {str(outcome)}")
+            results.append({
+                "github_pr_url": pr_request.github_pr_url,
+                "status": ProcessingStatus.FAILED.value,
+                "error": str(outcome)
+            })
+        else:
+            results.append({
+                "github_pr_url": pr_request.github_pr_url,
+                "status": outcome.status.value,
+                "summary": outcome
+            })
+    
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "total": len(results),
+        "succeeded": sum(1 for r in results if "summary" in r),
+        "results": results
+    }
+
 async def _process_summary_async(
     task_id: str,
     request: SummaryRequest,
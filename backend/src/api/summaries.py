@@ -50,12 +50,12 @@ async def create_pr_summary(request_data: Dict[str, Any]):
             )
         
         # Import and initialize services
-        from src.services.github import GitHubService, GitHubValidationError
-        from src.services.jira import JiraService, JiraValidationError
+        from src.services.github import GitHubValidationError, get_github_service
+        from src.services.jira import JiraValidationError, get_jira_service
         from src.services.gemini import GeminiService
         
-        github_service = GitHubService()
-        jira_service = JiraService()
+        github_service = get_github_service()
+        jira_service = get_jira_service()
         gemini_service = GeminiService()
         
         # Call GitHub service with validation
@@ -20,6 +20,8 @@ class GitHubConfig(BaseModel):
     base_url: str = Field(default="https://api.github.com", description="GitHub API base URL")
     timeout: float = Field(default=30.0, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retries")
+    oauth_client_id: Optional[str] = Field(default=None, description="GitHub OAuth app client ID")
+    oauth_client_secret: Optional[str] = Field(default=None, description="GitHub OAuth app client secret")
 
 
 class GeminiConfig(BaseModel):
@@ -79,7 +81,10 @@ class SecurityConfig(BaseModel):
     """Security and authentication configuration."""
     
     secret_key: str = Field(..., description="Secret key for JWT signing")
-    algorithm: str = Field(default="HS256", description="JWT signing algorithm")
+    algorithm: str = Field(
+        default="HS256",
+        description="JWT signing algorithm; asymmetric algorithms (EdDSA recommended) take a PEM private key as secret_key"
+    )
     access_token_expire_minutes: int = Field(default=30, description="Token expiration in minutes")
     cors_origins: List[str] = Field(default_factory=lambda: ["http://localhost:3000"], description="CORS allowed origins")
     cors_allow_credentials: bool = Field(default=True, description="Allow credentials in CORS")
@@ -159,9 +164,16 @@ def load_config() -> ApplicationConfig:
             debug=os.getenv("DEBUG", "false").lower() == "true",
             host=os.getenv("HOST", "127.0.0.1"),
             port=int(os.getenv("PORT", "8000")),
-            github=GitHubConfig(token=github_token),
+            github=GitHubConfig(
+                token=github_token,
+                oauth_client_id=os.getenv("GITHUB_OAUTH_CLIENT_ID"),
+                oauth_client_secret=os.getenv("GITHUB_OAUTH_CLIENT_SECRET")
+            ),
             gemini=GeminiConfig(api_key=gemini_api_key),
-            security=SecurityConfig(secret_key=secret_key),
+            security=SecurityConfig(
+                secret_key=secret_key,
+                algorithm=os.getenv("JWT_ALGORITHM", "HS256")
+            ),
             logging=LoggingConfig()
         )
         
@@ -5,9 +5,11 @@ This module defines the context models that aggregate data from multiple
 sources (GitHub, Jira, Confluence) for comprehensive PR summarization.
 """
 
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Tuple, Union
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
 from enum import Enum
 
 
@@ -25,7 +27,10 @@ class SourceMetadata(BaseModel):
     """Metadata about a data source."""
     
     source: DataSource = Field(..., description="The data source type")
-    retrieved_at: datetime = Field(default_factory=datetime.now)
+    retrieved_at_ns: int = Field(
+        default_factory=time.time_ns,
+        description="Retrieval time in nanoseconds since the epoch"
+    )
     api_version: Optional[str] = Field(None, description="API version used")
     rate_limit_remaining: Optional[int] = Field(None, description="Remaining API calls")
     cache_hit: bool = Field(False, description="Whether data came from cache")
@@ -42,6 +47,21 @@ class SourceMetadata(BaseModel):
                 "response_time_ms": 850
             }
         }
+    
+    @model_validator(mode='before')
+    @classmethod
+    def accept_retrieved_at(cls, data: Any) -> Any:
+        """Accept a retrieved_at datetime in place of retrieved_at_ns."""
+        if isinstance(data, dict) and isinstance(data.get('retrieved_at'), datetime):
+            data = dict(data)
+            data.setdefault('retrieved_at_ns', int(data.pop('retrieved_at').timestamp() * 1_000_000_000))
+        return data
+    
+    @computed_field
+    @property
+    def retrieved_at(self) -> datetime:
+        """Retrieval time, built from retrieved_at_ns when read."""
+        return datetime.fromtimestamp(self.retrieved_at_ns / 1_000_000_000)
 
 
 class GitHubPRContext(BaseModel):
@@ -104,6 +124,16 @@ class GitHubPRContext(BaseModel):
     # Source metadata
     metadata: SourceMetadata = Field(..., description="Source retrieval metadata")
     
+    @property
+    def content_key(self) -> Tuple[str, str, datetime]:
+        """Key identifying this revision of the PR's content."""
+        return (self.html_url, self.head_sha, self.updated_at)
+    
+    @cached_property
+    def created_at_iso(self) -> str:
+        """ISO 8601 form of created_at, formatted once per context."""
+        return self.created_at.isoformat()
+    
     @field_validator('state')
     @classmethod
     def validate_state(cls, v: str) -> str:
@@ -157,6 +187,11 @@ class JiraTicketContext(BaseModel):
     
     # Source metadata
     metadata: SourceMetadata = Field(..., description="Source retrieval metadata")
+    
+    @property
+    def content_key(self) -> Tuple[str, datetime]:
+        """Key identifying this revision of the ticket's content."""
+        return (self.key, self.updated_at)
 
 
 class ConfluencePageContext(BaseModel):
@@ -6,7 +6,7 @@ the exception system and provide structured error information to API clients.
 
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
+from uuid import uuid4 as _uuid4
 
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 
@@ -31,7 +31,7 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Human-readable error message")
     
     # Request context
-    correlation_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique request correlation ID")
+    correlation_id: str = Field(default_factory=lambda: _uuid4().hex, description="Unique request correlation ID")
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Error timestamp in UTC")
     
     # Error details
@@ -144,7 +144,7 @@ def create_error_response(
         Appropriate error response model
     """
     if correlation_id is None:
-        correlation_id = str(uuid4())
+        correlation_id = _uuid4().hex
     
     # Handle PRSummarizerError exceptions
     if isinstance(exception, PRSummarizerError):
@@ -234,24 +234,26 @@ def create_validation_error_response(
         Validation error response
     """
     if correlation_id is None:
-        correlation_id = str(uuid4())
+        correlation_id = _uuid4().hex
     
-    error_details = []
-    for error in errors:
-        error_detail = ErrorDetail(
+    # Field errors come from already-validated sources (FastAPI/pydantic), so
+    # skip re-validation and build the models directly.
+    error_details = [
+        ErrorDetail.model_construct(
             field=error.get('field'),
             message=error.get('message', 'Validation failed'),
             code=error.get('code', 'VALIDATION_ERROR'),
             value=error.get('value')
         )
-        error_details.append(error_detail)
+        for error in errors
+    ]
     
-    return ValidationErrorResponse(
+    return ValidationErrorResponse.model_construct(
         correlation_id=correlation_id,
         errors=error_details,
         path=path,
         method=method,
-        details={"error_count": len(errors)}
+        details={"error_count": len(error_details)}
     )
 
 
@@ -275,7 +277,7 @@ def create_not_found_response(
         Not found error response
     """
     if correlation_id is None:
-        correlation_id = str(uuid4())
+        correlation_id = _uuid4().hex
     
     message = f"{resource} not found"
     if resource_id:
@@ -315,7 +317,7 @@ def create_external_service_error_response(
         External service error response
     """
     if correlation_id is None:
-        correlation_id = str(uuid4())
+        correlation_id = _uuid4().hex
     
     details = {"service": service}
     if service_details:
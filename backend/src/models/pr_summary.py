@@ -6,7 +6,7 @@ including request/response models, summary sections, and processing status.
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -48,10 +48,9 @@ class SummarySection(BaseModel):
         description="Section content",
         min_length=1
     )
-    priority: str = Field(
+    priority: Literal["high", "medium", "low"] = Field(
         default="medium",
-        description="Section priority (high, medium, low)",
-        pattern="^(high|medium|low)$"
+        description="Section priority (high, medium, low)"
     )
     source: str = Field(
         ...,
@@ -197,10 +196,9 @@ class SummaryRequest(BaseModel):
         default=False,
         description="Include related Confluence documentation"
     )
-    priority: str = Field(
+    priority: Literal["high", "medium", "low"] = Field(
         default="medium",
-        description="Processing priority (high, medium, low)",
-        pattern="^(high|medium|low)$"
+        description="Processing priority (high, medium, low)"
     )
     options: Dict[str, Any] = Field(
         default_factory=dict,
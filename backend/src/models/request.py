@@ -5,7 +5,7 @@ This module defines the request models used by the PR summary generation
 endpoints, including validation rules and data structures.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 import re
 
@@ -91,10 +91,9 @@ class SummaryRequestWithOptions(SummaryRequest):
         max_length=10
     )
     
-    detail_level: Optional[str] = Field(
+    detail_level: Optional[Literal["low", "medium", "high"]] = Field(
         "medium",
-        description="Level of detail for the summary",
-        pattern="^(low|medium|high)$"
+        description="Level of detail for the summary"
     )
     
     include_code_examples: Optional[bool] = Field(
@@ -199,12 +198,9 @@ def validate_request_data(data: dict) -> SummaryRequest:
         Validated SummaryRequest instance
         
     Raises:
-        ValueError: If validation fails
+        pydantic.ValidationError: If validation fails (a ``ValueError`` subclass)
     """
-    try:
-        return SummaryRequest(**data)
-    except Exception as e:
-        raise ValueError(f"Request validation failed: {str(e)}")
+    return SummaryRequest(**data)
 
 
 def extract_github_info(github_url: str) -> tuple[str, str, int]:
@@ -3,16 +3,22 @@
 This package provides business logic services for the application.
 """
 
+import importlib
+
 from .auth import get_auth_service
 
-# Import the service modules to make them available for mocking
-try:
-    from . import github
-    from . import jira  
-    from . import gemini
-except ImportError:
-    # Services might have missing dependencies in test environment
-    # This is OK since we'll be mocking them
-    pass
-
-__all__ = ["get_auth_service", "github", "jira", "gemini"]
\ No newline at end of file
+# Integration services pull in heavy SDKs, so they are loaded on first
+# attribute access (PEP 562) rather than at package import.
+_LAZY_SUBMODULES = frozenset({"github", "jira", "gemini"})
+
+
+def __getattr__(name: str):
+    """Import integration service modules on first access."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["get_auth_service", "github", "jira", "gemini"]
@@ -4,10 +4,15 @@ This module provides user authentication, registration, and GitHub OAuth integra
 for the PR Summarizer application.
 """
 
+import asyncio
 import hashlib
+import hmac
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+import bcrypt
 import httpx
 
 from src.models.auth import (
@@ -21,6 +26,33 @@ from src.utils.logger import get_logger
 from src.utils.exceptions import PRSummarizerError
 
 
+GITHUB_OAUTH_TOKEN_URL = "https://github.com/login/oauth/access_token"
+
+# bcrypt work factor; 12 rounds is roughly 250 ms per hash on current hardware
+BCRYPT_ROUNDS = 12
+
+# Default permissions granted per role
+_ADMIN_PERMS = (
+    "read:projects", "write:projects", "delete:projects",
+    "read:summaries", "write:summaries", "delete:summaries",
+    "read:users", "write:users", "delete:users",
+    "admin:system",
+)
+_USER_PERMS = (
+    "read:projects", "write:projects",
+    "read:summaries", "write:summaries",
+)
+_READONLY_PERMS = (
+    "read:projects",
+    "read:summaries",
+)
+_PERM_TABLE: Dict[UserRole, Tuple[str, ...]] = {
+    UserRole.ADMIN: _ADMIN_PERMS,
+    UserRole.USER: _USER_PERMS,
+    UserRole.READONLY: _READONLY_PERMS,
+}
+
+
 class UserNotFoundError(PRSummarizerError):
     """User not found error."""
     
@@ -71,9 +103,31 @@ class AuthService:
         
         # In-memory user storage (replace with database in production)
         self._users: Dict[str, User] = {}
+        self._user_order: List[str] = []  # Insertion order, for pagination
         self._users_by_username: Dict[str, str] = {}
         self._users_by_email: Dict[str, str] = {}
+        self._users_by_github_id: Dict[str, str] = {}
         self._passwords: Dict[str, str] = {}  # Store hashed passwords by user_id
+        # Plain passwords not yet hashed, hashed off the event loop on first login
+        self._pending_passwords: Dict[str, str] = {}
+        
+        # Shared HTTP client for GitHub OAuth so connections (and TLS sessions)
+        # are reused across logins
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers={"Accept": "application/json", "User-Agent": "PR-Summarizer"}
+        )
+        
+        # Validated response DTOs by user_id; entries are dropped whenever the
+        # underlying User is mutated
+        self._response_cache: Dict[str, UserResponse] = {}
+        
+        # bcrypt is deliberately slow, so hashing runs off the event loop
+        self._pw_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="auth-pw"
+        )
         
         # Create default admin user if configured
         self._create_default_admin()
@@ -89,31 +143,47 @@ class AuthService:
             role=UserRole.ADMIN,
             status=UserStatus.ACTIVE,
             auth_provider=AuthProvider.LOCAL,
-            permissions=[
-                "read:projects", "write:projects", "delete:projects",
-                "read:summaries", "write:summaries", "delete:summaries",
-                "read:users", "write:users", "delete:users",
-                "admin:system"
-            ]
+            permissions=list(_ADMIN_PERMS)
         )
         self._store_user(admin_user)
-        # Store admin password
-        self._passwords[admin_user.id] = self._hash_password("admin123")
+        # Hashed on first login; bcrypt here would block whichever request builds the service
+        self._pending_passwords[admin_user.id] = "admin123"
         self.logger.info("Default admin user created", extra={
             "user_id": admin_user.id,
             "username": admin_user.username
         })
     
     def _store_user(self, user: User):
-        """Store user in memory storage."""
+        """Store user in memory storage.
+        
+        Username and email index keys are case-folded here so lookups only
+        need to lowercase their input.
+        """
+        if user.id not in self._users:
+            self._user_order.append(user.id)
         self._users[user.id] = user
-        self._users_by_username[user.username] = user.id
-        self._users_by_email[user.email] = user.id
+        self._users_by_username[user.username.lower()] = user.id
+        self._users_by_email[user.email.lower()] = user.id
+        if user.github_id:
+            self._users_by_github_id[user.github_id] = user.id
+    
+    def _response_for(self, user: User) -> UserResponse:
+        """Get the response model for a user from the cache, building it on a miss.
+        
+        Callers get a copy with its own permissions list, so changing the
+        returned model leaves the cached one intact.
+        """
+        response = self._response_cache.get(user.id)
+        if response is None:
+            response = UserResponse.model_validate(user, from_attributes=True)
+            self._response_cache[user.id] = response
+        return response.model_copy(update={"permissions": list(response.permissions)})
     
     def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256 with salt.
+        """Hash password using bcrypt.
         
-        In production, use bcrypt or similar strong hashing algorithm.
+        This is CPU-bound (~250 ms at cost 12); async callers should go
+        through ``_hash_password_async``.
         
         Args:
             password: Plain text password
@@ -121,13 +191,15 @@ class AuthService:
         Returns:
             Hashed password
         """
-        salt = secrets.token_hex(32)
-        pwd_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return f"{salt}:{pwd_hash}"
+        # bcrypt only considers the first 72 bytes of the password
+        hashed = bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+        return hashed.decode()
     
     def _verify_password(self, password: str, hashed: str) -> bool:
         """Verify password against hash.
         
+        Supports bcrypt hashes as well as legacy ``salt:sha256`` hashes.
+        
         Args:
             password: Plain text password
             hashed: Stored password hash
@@ -135,11 +207,29 @@ class AuthService:
         Returns:
             True if password matches
         """
-        try:
-            salt, pwd_hash = hashed.split(":", 1)
-            return hashlib.sha256((password + salt).encode()).hexdigest() == pwd_hash
-        except ValueError:
+        if hashed.startswith("$2"):
+            return bcrypt.checkpw(password.encode()[:72], hashed.encode())
+        
+        if ":" not in hashed:
             return False
+        
+        salt, pwd_hash = hashed.split(":", 1)
+        # Constant-time comparison so response timing doesn't leak the hash
+        return hmac.compare_digest(
+            hashlib.sha256((password + salt).encode()).hexdigest(), pwd_hash
+        )
+    
+    async def _hash_password_async(self, password: str) -> str:
+        """Hash password in the password thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pw_executor, self._hash_password, password)
+    
+    async def _verify_password_async(self, password: str, hashed: str) -> bool:
+        """Verify password in the password thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pw_executor, self._verify_password, password, hashed
+        )
     
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create new user account.
@@ -153,11 +243,16 @@ class AuthService:
         Raises:
             UserExistsError: If user already exists
         """
+        # Hash first so no await separates the uniqueness check from the store
+        password_hash = None
+        if user_data.password and user_data.auth_provider == AuthProvider.LOCAL:
+            password_hash = await self._hash_password_async(user_data.password)
+        
         # Check if username or email already exists
-        if user_data.username in self._users_by_username:
+        if user_data.username.lower() in self._users_by_username:
             raise UserExistsError("username", user_data.username)
         
-        if user_data.email in self._users_by_email:
+        if user_data.email.lower() in self._users_by_email:
             raise UserExistsError("email", user_data.email)
         
         # Generate user ID
@@ -171,13 +266,12 @@ class AuthService:
             full_name=user_data.full_name,
             role=user_data.role,
             auth_provider=user_data.auth_provider,
-            permissions=self._get_default_permissions(user_data.role)
+            permissions=AuthService._get_default_permissions(user_data.role)
         )
         
         # Store password hash if provided (local auth)
-        if user_data.password and user_data.auth_provider == AuthProvider.LOCAL:
-            # Store in passwords dictionary
-            self._passwords[user_id] = self._hash_password(user_data.password)
+        if password_hash:
+            self._passwords[user_id] = password_hash
         
         self._store_user(user)
         
@@ -188,7 +282,7 @@ class AuthService:
             "role": user.role
         })
         
-        return UserResponse(**user.dict())
+        return self._response_for(user)
     
     async def authenticate_user(self, login_data: LoginRequest) -> LoginResponse:
         """Authenticate user with username/password.
@@ -204,9 +298,10 @@ class AuthService:
             UserNotFoundError: If user doesn't exist
         """
         # Find user by username or email
-        user_id = self._users_by_username.get(login_data.username)
+        login_key = login_data.username.lower()
+        user_id = self._users_by_username.get(login_key)
         if not user_id:
-            user_id = self._users_by_email.get(login_data.username)
+            user_id = self._users_by_email.get(login_key)
         
         if not user_id:
             raise UserNotFoundError(login_data.username)
@@ -220,11 +315,19 @@ class AuthService:
         # Verify password for local auth
         if user.auth_provider == AuthProvider.LOCAL:
             password_hash = self._passwords.get(user_id)
-            if not password_hash or not self._verify_password(login_data.password, password_hash):
+            if password_hash is None and user_id in self._pending_passwords:
+                password_hash = await self._hash_password_async(self._pending_passwords[user_id])
+                # A concurrent login may have stored its hash first; keep that one
+                password_hash = self._passwords.setdefault(user_id, password_hash)
+                self._pending_passwords.pop(user_id, None)
+            if not password_hash or not await self._verify_password_async(
+                login_data.password, password_hash
+            ):
                 raise InvalidCredentialsError()
         
         # Update last login time
         user.last_login_at = datetime.now(timezone.utc)
+        self._response_cache.pop(user.id, None)
         
         # Generate tokens
         access_token = self.jwt_manager.create_access_token(
@@ -247,7 +350,7 @@ class AuthService:
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=self.config.security.access_token_expire_minutes * 60,
-            user=UserResponse(**user.dict())
+            user=self._response_for(user)
         )
     
     async def refresh_token(self, refresh_data: RefreshTokenRequest) -> RefreshTokenResponse:
@@ -290,6 +393,7 @@ class AuthService:
             
             # Update last login time
             user.last_login_at = datetime.now(timezone.utc)
+            self._response_cache.pop(user.id, None)
             
             # Generate tokens
             access_token = self.jwt_manager.create_access_token(
@@ -313,9 +417,12 @@ class AuthService:
                 access_token=access_token,
                 refresh_token=refresh_token,
                 expires_in=self.config.security.access_token_expire_minutes * 60,
-                user=UserResponse(**user.dict())
+                user=self._response_for(user)
             )
             
+        except GitHubOAuthError as e:
+            self.logger.error("GitHub OAuth failed", extra={"error": str(e)})
+            raise
         except Exception as e:
             self.logger.error("GitHub OAuth failed", extra={"error": str(e)})
             raise GitHubOAuthError(str(e))
@@ -328,15 +435,34 @@ class AuthService:
             
         Returns:
             GitHub access token
+            
+        Raises:
+            GitHubOAuthError: If OAuth is not configured or the exchange fails
         """
-        # This is a simplified implementation
-        # In production, use actual GitHub OAuth configuration
-        
-        # For now, return a mock token for testing
-        # In real implementation:
-        # POST to https://github.com/login/oauth/access_token
+        github_config = self.config.github
+        if not github_config.oauth_client_id or not github_config.oauth_client_secret:
+            raise GitHubOAuthError("GitHub OAuth client is not configured")
+        
+        response = await self._http.post(
+            GITHUB_OAUTH_TOKEN_URL,
+            data={
+                "client_id": github_config.oauth_client_id,
+                "client_secret": github_config.oauth_client_secret,
+                "code": code
+            }
+        )
+        response.raise_for_status()
+        token_data = response.json()
+        
+        # GitHub reports exchange failures with a 200 and an error payload
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise GitHubOAuthError(
+                token_data.get("error_description", "Token exchange failed"),
+                details={"error": token_data.get("error")}
+            )
         
-        return f"gho_mock_token_{secrets.token_hex(16)}"
+        return access_token
     
     async def _get_github_user(self, token: str) -> GitHubUser:
         """Get user information from GitHub API.
@@ -347,16 +473,19 @@ class AuthService:
         Returns:
             GitHub user information
         """
-        # This is a simplified implementation
-        # In production, make actual API call to GitHub
+        response = await self._http.get(
+            f"{self.config.github.base_url}/user",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        user_data = response.json()
         
-        # Mock GitHub user for testing
         return GitHubUser(
-            id=12345,
-            login="testuser",
-            name="Test User",
-            email="testuser@example.com",
-            avatar_url="https://avatars.githubusercontent.com/u/12345"
+            id=user_data["id"],
+            login=user_data["login"],
+            name=user_data.get("name"),
+            email=user_data.get("email"),
+            avatar_url=user_data.get("avatar_url")
         )
     
     async def _find_or_create_github_user(self, github_user: GitHubUser) -> User:
@@ -368,23 +497,30 @@ class AuthService:
         Returns:
             User object
         """
+        github_id = str(github_user.id)
+        
         # Look for existing user by GitHub ID
-        for user in self._users.values():
-            if user.github_id == str(github_user.id):
-                # Update user info from GitHub
-                user.full_name = github_user.name or user.full_name
-                user.avatar_url = github_user.avatar_url or user.avatar_url
-                return user
+        existing_id = self._users_by_github_id.get(github_id)
+        if existing_id:
+            user = self._users[existing_id]
+            # Update user info from GitHub
+            user.full_name = github_user.name or user.full_name
+            user.avatar_url = github_user.avatar_url or user.avatar_url
+            self._response_cache.pop(user.id, None)
+            return user
         
         # Look for existing user by email
-        if github_user.email and github_user.email in self._users_by_email:
-            user_id = self._users_by_email[github_user.email]
+        email_key = github_user.email.lower() if github_user.email else None
+        if email_key and email_key in self._users_by_email:
+            user_id = self._users_by_email[email_key]
             user = self._users[user_id]
             
             # Link GitHub account
-            user.github_id = str(github_user.id)
+            user.github_id = github_id
             user.github_username = github_user.login
             user.auth_provider = AuthProvider.GITHUB
+            self._users_by_github_id[github_id] = user.id
+            self._response_cache.pop(user.id, None)
             
             return user
         
@@ -400,9 +536,9 @@ class AuthService:
             role=UserRole.USER,
             status=UserStatus.ACTIVE,
             auth_provider=AuthProvider.GITHUB,
-            github_id=str(github_user.id),
+            github_id=github_id,
             github_username=github_user.login,
-            permissions=self._get_default_permissions(UserRole.USER)
+            permissions=AuthService._get_default_permissions(UserRole.USER)
         )
         
         self._store_user(user)
@@ -426,7 +562,7 @@ class AuthService:
         """
         user = self._users.get(user_id)
         if user:
-            return UserResponse(**user.dict())
+            return self._response_for(user)
         return None
     
     async def get_user_by_username(self, username: str) -> Optional[UserResponse]:
@@ -441,7 +577,7 @@ class AuthService:
         user_id = self._users_by_username.get(username.lower())
         if user_id:
             user = self._users[user_id]
-            return UserResponse(**user.dict())
+            return self._response_for(user)
         return None
     
     async def update_user(self, user_id: str, update_data: UserUpdate) -> UserResponse:
@@ -467,13 +603,14 @@ class AuthService:
             setattr(user, field, value)
         
         user.updated_at = datetime.now(timezone.utc)
+        self._response_cache.pop(user.id, None)
         
         self.logger.info("User updated", extra={
             "user_id": user.id,
             "updated_fields": list(update_dict.keys())
         })
         
-        return UserResponse(**user.dict())
+        return self._response_for(user)
     
     async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
         """List users with pagination.
@@ -485,12 +622,20 @@ class AuthService:
         Returns:
             List of users
         """
-        users = list(self._users.values())
-        paginated_users = users[skip:skip + limit]
+        users = self._users
         
-        return [UserResponse(**user.dict()) for user in paginated_users]
+        return [
+            self._response_for(users[user_id])
+            for user_id in self._user_order[skip:skip + limit]
+        ]
+    
+    async def aclose(self) -> None:
+        """Release the HTTP client and password hashing pool."""
+        await self._http.aclose()
+        self._pw_executor.shutdown(wait=False)
     
-    def _get_default_permissions(self, role: UserRole) -> List[str]:
+    @staticmethod
+    def _get_default_permissions(role: UserRole) -> List[str]:
         """Get default permissions for user role.
         
         Args:
@@ -499,23 +644,7 @@ class AuthService:
         Returns:
             List of default permissions
         """
-        if role == UserRole.ADMIN:
-            return [
-                "read:projects", "write:projects", "delete:projects",
-                "read:summaries", "write:summaries", "delete:summaries",
-                "read:users", "write:users", "delete:users",
-                "admin:system"
-            ]
-        elif role == UserRole.USER:
-            return [
-                "read:projects", "write:projects",
-                "read:summaries", "write:summaries"
-            ]
-        else:  # READONLY
-            return [
-                "read:projects",
-                "read:summaries"
-            ]
+        return list(_PERM_TABLE.get(role, _READONLY_PERMS))
 
 
 # Singleton auth service instance
@@ -531,4 +660,12 @@ def get_auth_service() -> AuthService:
     global _auth_service
     if _auth_service is None:
         _auth_service = AuthService()
-    return _auth_service
\ No newline at end of file
+    return _auth_service
+
+
+async def close_auth_service() -> None:
+    """Close the singleton auth service, if one was created."""
+    global _auth_service
+    if _auth_service is not None:
+        await _auth_service.aclose()
+        _auth_service = None
@@ -0,0 +1,98 @@
+"""In-process caching helpers for service results.
+
+This module provides a small TTL + LRU cache and a decorator for memoizing
+async fetch methods on service instances.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire a fixed time after insertion."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted
+            ttl: Seconds an entry stays fresh
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def memoized_fetch(
+    ttl: float,
+    maxsize: int = 256,
+    key: Optional[Callable[..., Hashable]] = None,
+    on_hit: Optional[Callable[[T], T]] = None
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Memoize an async method per instance with a TTL cache.
+    
+    Each instance gets its own cache, so separately configured services never
+    share entries. Exceptions are not cached.
+    
+    Args:
+        ttl: Seconds a result stays fresh
+        maxsize: Maximum cached results per instance
+        key: Builds the cache key from the call arguments (excluding self);
+            defaults to the positional arguments
+        on_hit: Applied to a cached result before it is returned, e.g. to
+            flag it as served from cache
+    """
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache_attr = f"_memo_{fn.__name__}"
+        
+        @functools.wraps(fn)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+            caches: Dict[str, TTLCache] = self.__dict__
+            cache = caches.get(cache_attr)
+            if cache is None:
+                cache = caches[cache_attr] = TTLCache(maxsize, ttl)
+            
+            cache_key = key(*args, **kwargs) if key is not None else args
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return on_hit(cached) if on_hit is not None else cached
+            
+            result = await fn(self, *args, **kwargs)
+            cache.set(cache_key, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
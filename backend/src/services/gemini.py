@@ -1,11 +1,39 @@
 """Gemini AI service for generating PR summaries."""
 
+import asyncio
+import hashlib
 import os
-import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 import google.generativeai as genai
+import orjson
 from datetime import datetime, timezone
 from src.models.pr_summary import PRSummary, ProcessingStatus
+from src.services.cache import TTLCache
+
+
+# Constant parts of the analysis prompt; only the PR/Jira section in between
+# varies per request.
+_PROMPT_HEADER = (
+    "You are an expert code reviewer and technical analyst. Analyze the following Pull Request and provide a comprehensive summary.\n"
+    "\n"
+    "## Pull Request Information:\n"
+)
+
+_PROMPT_JSON_SCHEMA = (
+    "\n"
+    "Please provide a detailed analysis in the following JSON format:\n"
+    "{\n"
+    '  "business_context": "Detailed explanation of the business purpose and value of these changes",\n'
+    '  "code_change_summary": "Technical summary of what was modified, added, or removed",\n'
+    '  "business_code_impact": "Analysis of how code changes affect business functionality and user experience",\n'
+    '  "suggested_test_cases": ["Specific test case 1", "Specific test case 2", "Specific test case 3"],\n'
+    '  "risk_complexity": "Assessment of complexity level and potential risks with specific concerns",\n'
+    '  "reviewer_guidance": "Specific areas reviewers should focus on during code review"\n'
+    "}\n"
+    "\n"
+    "Make sure your response is valid JSON and provide specific, actionable insights based on the actual code changes."
+)
 
 
 class GeminiServiceError(Exception):
@@ -13,9 +41,64 @@ class GeminiServiceError(Exception):
     pass
 
 
+def _extract_json_block(text: str, start: int = 0) -> Optional[Tuple[int, int]]:
+    """Locate the first balanced ``{...}`` block in text at or after start.
+    
+    A single pass keeps a stack of open-brace positions. Braces inside JSON
+    string literals (including escaped quotes) are ignored, so prose or code
+    snippets in string values don't throw off the match. Braces that are
+    never closed are skipped, and the earliest block that did close wins.
+    
+    Returns:
+        ``(begin, end)`` slice indices of the block, or None if there is none
+    """
+    opened: List[int] = []
+    best: Optional[Tuple[int, int]] = None
+    in_str = False
+    esc = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == '\\':
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '{':
+            opened.append(i)
+        elif not opened:
+            # Prose between blocks: quotes there don't open strings
+            continue
+        elif ch == '"':
+            in_str = True
+        elif ch == '}':
+            begin = opened.pop()
+            if not opened:
+                return begin, i + 1
+            # Closed inside a brace that may never close; an enclosing block
+            # that does close later starts earlier and replaces it
+            if best is None or begin < best[0]:
+                best = (begin, i + 1)
+    
+    return best
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap text at limit characters, marking truncation with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class GeminiService:
     """Service for Gemini AI operations."""
     
+    # Parsed responses are cached per prompt so repeat requests for an
+    # unchanged PR skip the LLM round-trip. Kept short, since a cached entry
+    # means asking again returns the same summary; options["cache"] = False
+    # forces a fresh generation.
+    PROMPT_CACHE_MAX_ENTRIES = 512
+    PROMPT_CACHE_TTL_SECONDS = 300
+    
     def __init__(self, api_key: str = None, model_name: str = "models/gemini-2.0-flash"):
         """Initialize Gemini service."""
         self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
@@ -24,31 +107,68 @@ class GeminiService:
         
         self.model_name = model_name
         
-        # Configure the API
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(model_name)
+        # The SDK client is created on first use; see the model property
+        self._model = None
+        
+        # Prompt hash -> parsed summary data
+        self._prompt_cache = TTLCache(self.PROMPT_CACHE_MAX_ENTRIES, self.PROMPT_CACHE_TTL_SECONDS)
         
+    @property
+    def model(self) -> genai.GenerativeModel:
+        """Gemini model client, configured on first access."""
+        if self._model is None:
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(self.model_name)
+        return self._model
+    
+    @model.setter
+    def model(self, value: genai.GenerativeModel) -> None:
+        self._model = value
+    
     async def generate_summary(
         self,
         pr_data: Dict[str, Any],
         jira_data: Dict[str, Any] = None,
         confluence_data: Dict[str, Any] = None,
-        options: Dict[str, Any] = None
+        options: Mapping[str, Any] = None
     ) -> PRSummary:
-        """Generate PR summary using Gemini AI."""
+        """Generate PR summary using Gemini AI.
+        
+        ``options`` is only read, so callers may pass any mapping, such as a
+        ChainMap overlay, without copying it first.
+        """
+        t0 = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        ts_int = int(now.timestamp())
+        options = options or {}
+        
         try:
             # Build comprehensive prompt from PR data
             prompt = self._build_analysis_prompt(pr_data, jira_data, confluence_data)
             
-            # Generate content using Gemini
-            response = self.model.generate_content(prompt)
+            # A cache bypass still stores its fresh result for later requests
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            summary_data = self._prompt_cache.get(cache_key) if options.get("cache", True) else None
             
-            # Parse the AI response
-            summary_data = self._parse_ai_response(response.text)
+            if summary_data is None:
+                # Generate content using Gemini without blocking the event loop
+                generate_async = getattr(self.model, "generate_content_async", None)
+                if generate_async is not None:
+                    response = await generate_async(prompt)
+                else:
+                    response = await asyncio.to_thread(self.model.generate_content, prompt)
+                
+                # Parse the AI response; a fallback for an unparseable reply
+                # is not cached, so the next identical request asks again
+                summary_data = self._parse_json_response(response.text)
+                if summary_data is None:
+                    summary_data = self._create_fallback_summary(response.text)
+                else:
+                    self._prompt_cache.set(cache_key, summary_data)
             
             return PRSummary(
-                id=f"summary-{int(datetime.now(timezone.utc).timestamp())}",
-                request_id=options.get('request_id', f"req-{int(datetime.now(timezone.utc).timestamp())}") if options else f"req-{int(datetime.now(timezone.utc).timestamp())}",
+                id=f"summary-{ts_int}",
+                request_id=options.get('request_id', f"req-{ts_int}"),
                 github_pr_url=options.get('github_pr_url', pr_data.get("url", pr_data.get("html_url", ""))),
                 jira_ticket_id=jira_data.get("key") if jira_data else None,
                 business_context=summary_data.get("business_context", "Business context analysis from PR changes"),
@@ -58,93 +178,104 @@ class GeminiService:
                 risk_complexity=summary_data.get("risk_complexity", "Medium complexity - requires standard review"),
                 reviewer_guidance=summary_data.get("reviewer_guidance", "Standard code review focusing on logic and security"),
                 status=ProcessingStatus.COMPLETED,
-                created_at=datetime.now(timezone.utc),
-                processing_time_ms=int((datetime.now(timezone.utc).timestamp() - datetime.now(timezone.utc).timestamp()) * 1000)
+                created_at=now,
+                processing_time_ms=int((time.perf_counter() - t0) * 1000)
             )
             
         except Exception as e:
             raise GeminiServiceError(f"Failed to generate AI summary: {str(e)}")
     
+    async def generate_summaries_batch(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Union[PRSummary, BaseException]]:
+        """Generate summaries for several PRs concurrently.
+        
+        Each item holds the keyword arguments for ``generate_summary``. Results
+        come back in input order; a failed item yields its exception instead
+        of aborting the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate_one(item: Dict[str, Any]) -> PRSummary:
+            async with semaphore:
+                return await self.generate_summary(**item)
+        
+        return await asyncio.gather(
+            *(generate_one(item) for item in items),
+            return_exceptions=True
+        )
+    
     def _build_analysis_prompt(self, pr_data: Dict[str, Any], jira_data: Dict[str, Any] = None, confluence_data: Dict[str, Any] = None) -> str:
         """Build comprehensive analysis prompt for Gemini."""
+        g = pr_data.get
+        buf = []
+        a = buf.append
         
-        prompt_parts = [
-            "You are an expert code reviewer and technical analyst. Analyze the following Pull Request and provide a comprehensive summary.",
-            "",
-            "## Pull Request Information:",
-            f"Title: {pr_data.get('title', 'N/A')}",
-            f"Description: {pr_data.get('body', 'No description provided')}",
-            f"Files Changed: {pr_data.get('files_changed', 0)}",
-            f"Lines Added: {pr_data.get('additions', 0)}",
-            f"Lines Deleted: {pr_data.get('deletions', 0)}",
-            f"Repository: {pr_data.get('repository', 'N/A')}",
-            f"Branch: {pr_data.get('head_branch', 'N/A')} → {pr_data.get('base_branch', 'N/A')}",
-        ]
+        a(f"Title: {g('title', 'N/A')}\n"
+          f"Description: {g('body', 'No description provided')}\n"
+          f"Files Changed: {g('files_changed', 0)}\n"
+          f"Lines Added: {g('additions', 0)}\n"
+          f"Lines Deleted: {g('deletions', 0)}\n"
+          f"Repository: {g('repository', 'N/A')}\n"
+          f"Branch: {g('head_branch', 'N/A')} → {g('base_branch', 'N/A')}\n")
         
-        # Add file changes if available
-        if pr_data.get('changed_files'):
-            prompt_parts.extend([
-                "",
-                "## Changed Files:",
-            ])
-            for file in pr_data['changed_files'][:10]:  # Limit to first 10 files
-                prompt_parts.append(f"- {file['filename']} ({file['status']}: +{file['additions']} -{file['deletions']})")
-                if file.get('patch'):
-                    prompt_parts.append(f"  Code changes preview: {file['patch'][:200]}...")
+        # Add file changes if available (first 10 files)
+        changed_files = g('changed_files')
+        if changed_files:
+            a("\n## Changed Files:\n")
+            a("".join(
+                f"- {file['filename']} ({file['status']}: +{file['additions']} -{file['deletions']})\n"
+                + (f"  Code changes preview: {_truncate(file['patch'], 200)}\n" if file.get('patch') else "")
+                for file in changed_files[:10]
+            ))
         
-        # Add commit information
-        if pr_data.get('commits'):
-            prompt_parts.extend([
-                "",
-                "## Recent Commits:",
-            ])
-            for commit in pr_data['commits'][-5:]:  # Last 5 commits
-                prompt_parts.append(f"- {commit['sha'][:8]}: {commit['message'][:100]} (by {commit['author']})")
+        # Add commit information (last 5 commits)
+        commits = g('commits')
+        if commits:
+            a("\n## Recent Commits:\n")
+            a("".join(
+                f"- {commit['sha'][:8]}: {_truncate(commit['message'], 100)} (by {commit['author']})\n"
+                for commit in commits[-5:]
+            ))
         
         # Add Jira context if available
         if jira_data:
-            prompt_parts.extend([
-                "",
-                "## Related Jira Ticket:",
-                f"Key: {jira_data.get('key', 'N/A')}",
-                f"Summary: {jira_data.get('summary', 'N/A')}",
-                f"Description: {jira_data.get('description', 'N/A')[:500]}...",
-            ])
+            a("\n## Related Jira Ticket:\n"
+              f"Key: {jira_data.get('key', 'N/A')}\n"
+              f"Summary: {jira_data.get('summary', 'N/A')}\n"
+              f"Description: {_truncate(jira_data.get('description', 'N/A'), 500)}\n")
         
-        prompt_parts.extend([
-            "",
-            "Please provide a detailed analysis in the following JSON format:",
-            "{",
-            '  "business_context": "Detailed explanation of the business purpose and value of these changes",',
-            '  "code_change_summary": "Technical summary of what was modified, added, or removed",',
-            '  "business_code_impact": "Analysis of how code changes affect business functionality and user experience",',
-            '  "suggested_test_cases": ["Specific test case 1", "Specific test case 2", "Specific test case 3"],',
-            '  "risk_complexity": "Assessment of complexity level and potential risks with specific concerns",',
-            '  "reviewer_guidance": "Specific areas reviewers should focus on during code review"',
-            "}",
-            "",
-            "Make sure your response is valid JSON and provide specific, actionable insights based on the actual code changes."
-        ])
-        
-        return "\n".join(prompt_parts)
+        return _PROMPT_HEADER + "".join(buf) + _PROMPT_JSON_SCHEMA
     
     def _parse_ai_response(self, response_text: str) -> Dict[str, Any]:
         """Parse AI response and extract structured data."""
-        try:
-            # Try to extract JSON from the response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            
-            if start_idx >= 0 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                return json.loads(json_str)
-            else:
-                # Fallback if no JSON found
-                return self._create_fallback_summary(response_text)
-                
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
+        parsed = self._parse_json_response(response_text)
+        if parsed is None:
+            # Fallback if no JSON found
             return self._create_fallback_summary(response_text)
+        return parsed
+    
+    def _parse_json_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """Return the first JSON object in an AI response, or None if there is none."""
+        # Try each balanced block in turn, so unclosed braces or {...} that
+        # isn't JSON in leading prose just move the search forward.
+        search_from = 0
+        while True:
+            span = _extract_json_block(response_text, search_from)
+            if span is None:
+                return None
+            
+            begin, end = span
+            try:
+                parsed = orjson.loads(response_text[begin:end])
+            except orjson.JSONDecodeError:
+                parsed = None
+            
+            if isinstance(parsed, dict):
+                return parsed
+            search_from = begin + 1
     
     def _create_fallback_summary(self, raw_text: str) -> Dict[str, Any]:
         """Create fallback summary when JSON parsing fails."""
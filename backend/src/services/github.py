@@ -1,12 +1,61 @@
 """GitHub service for interacting with GitHub API."""
 
+import functools
 import os
+import random
 import re
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Any, Optional, Tuple
 import asyncio
+import time
 import httpx
+import orjson
 from datetime import datetime
 
+from src.services.cache import TTLCache
+from src.services.http_client import create_http_client, get_http_client
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# GitHub PR URL: https://github.com/{owner}/{repo}/pull/{number}
+_PR_URL_RE = re.compile(r'^https://github\.com/([^/]+)/([^/]+)/pull/(\d+)/?$')
+
+# PR metadata and recent commits in one round-trip. File patches are not
+# exposed over GraphQL, so files still come from the REST endpoint.
+_PR_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number title body state isDraft mergeable merged url
+      createdAt updatedAt
+      author { login }
+      headRefName baseRefName headRefOid baseRefOid
+      additions deletions changedFiles
+      labels(first: 20) { nodes { name } }
+      comments { totalCount }
+      reviewThreads(first: 100) { nodes { comments { totalCount } } }
+      commits(last: 10) {
+        nodes { commit { oid message author { name date } } }
+      }
+    }
+  }
+}
+"""
+
+# Number of changed files included in the PR details, and the per-file
+# patch preview length
+MAX_FILES = 20
+MAX_PATCH_CHARS = 1000
+
+# Statuses worth retrying; 401/403/404 won't change on a retry
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# GraphQL MergeableState -> REST mergeable flag
+_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False}
+
 
 class GitHubServiceError(Exception):
     """Base exception for GitHub service errors."""
@@ -21,8 +70,37 @@ class GitHubValidationError(GitHubServiceError):
 class GitHubService:
     """Service for GitHub API operations."""
     
-    def __init__(self, token: str = None):
-        """Initialize GitHub service."""
+    # Conditional requests answered with 304 don't count against the rate
+    # limit, so bodies are kept per URL alongside their ETag
+    ETAG_CACHE_MAX_ENTRIES = 256
+    
+    # Assembled PR details are reused for a short window so re-triggered
+    # summaries and polling skip the API entirely
+    PR_CACHE_MAX_ENTRIES = 256
+    PR_CACHE_TTL_SECONDS = 120
+    
+    # Concurrent requests allowed against the API; bursts beyond this trip
+    # GitHub's secondary rate limits
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    # When fewer requests than this remain in the rate-limit window, hold
+    # new requests until the window resets (waiting at most the cap)
+    RATE_LIMIT_LOW_WATER = 10
+    RATE_LIMIT_MAX_WAIT_SECONDS = 60.0
+    
+    # Retries for transient failures, with jittered exponential backoff
+    MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY_SECONDS = 0.3
+    RETRY_MAX_DELAY_SECONDS = 5.0
+    
+    def __init__(self, token: str = None, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize GitHub service.
+        
+        Args:
+            token: GitHub token; defaults to the GITHUB_TOKEN environment variable
+            http_client: Client to share with other services. The caller keeps
+                ownership and closes it; by default the service creates its own.
+        """
         self.token = token or os.getenv('GITHUB_TOKEN')
         if not self.token:
             raise GitHubServiceError("GitHub token is required. Set GITHUB_TOKEN environment variable.")
@@ -34,109 +112,310 @@ class GitHubService:
             "User-Agent": "PR-Summarizer/1.0"
         }
         
+        # Pooled HTTP/2 client so every PR fetch reuses connections to
+        # api.github.com instead of paying a fresh TCP+TLS handshake. Requests
+        # carry absolute URLs and auth headers (see _send), so an owned client
+        # is configured exactly like the shared one.
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client()
+        
+        # URL -> (ETag, decoded body), least recently used first
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        
+        # (owner, repo, number) -> details, plus fetches in flight
+        self._pr_cache = TTLCache(self.PR_CACHE_MAX_ENTRIES, self.PR_CACHE_TTL_SECONDS)
+        self._inflight: Dict[Tuple[str, str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+        
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._paused_until = 0.0  # time.time() before which requests wait
+        
     async def get_pr_details(self, pr_url: str) -> Dict[str, Any]:
-        """Get PR details from GitHub API."""
-        # Validate URL format first
-        if not self._is_valid_github_pr_url(pr_url):
-            raise GitHubValidationError(f"Invalid GitHub PR URL format: {pr_url}")
+        """Get PR details from GitHub API.
+        
+        Results are cached briefly per PR, and concurrent calls for the same
+        PR share a single fetch.
+        """
+        cached = self.cached_pr_details(pr_url)
+        if cached is not None:
+            return cached
         
-        # Extract owner, repo, and PR number from URL
         owner, repo, pr_number = self._extract_pr_info(pr_url)
+        key = (owner, repo, pr_number)
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # Get PR details
-                pr_response = await client.get(
-                    f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}",
-                    headers=self.headers,
-                    timeout=30.0
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_pr_details(pr_url, owner, repo, pr_number))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield the shared fetch so one cancelled caller doesn't cancel it for
+        # everyone else waiting on the same PR
+        details = await asyncio.shield(task)
+        
+        self._pr_cache.set(key, details)
+        return {**details, "url": pr_url}
+    
+    def cached_pr_details(self, pr_url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached PR details for a URL, or None if not fresh."""
+        # Validate URL format and extract owner, repo, and PR number
+        details = self._pr_cache.get(self._extract_pr_info(pr_url))
+        if details is None:
+            return None
+        return {**details, "url": pr_url}
+    
+    def pr_cache_size(self) -> int:
+        """Number of PRs held in the details cache."""
+        return len(self._pr_cache)
+    
+    async def _fetch_pr_details(self, pr_url: str, owner: str, repo: str, pr_number: str) -> Dict[str, Any]:
+        """Fetch and assemble PR details from the GitHub API."""
+        try:
+            # PR metadata and the file list are independent, so fetch them concurrently
+            pr_data, files_data = await asyncio.gather(
+                self._graphql(_PR_QUERY, {"owner": owner, "repo": repo, "number": int(pr_number)}),
+                self._get_json(
+                    f"/repos/{owner}/{repo}/pulls/{pr_number}/files"
+                    f"?per_page={MAX_FILES}&page=1"
                 )
-                pr_response.raise_for_status()
-                pr_data = pr_response.json()
-                
-                # Get PR files/diff
-                files_response = await client.get(
-                    f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files",
-                    headers=self.headers,
-                    timeout=30.0
+            )
+            
+            pr = (pr_data.get("repository") or {}).get("pullRequest")
+            if pr is None:
+                raise GitHubServiceError(f"PR not found: {pr_url}")
+            
+            html_url = pr["url"]
+            author = pr["author"]
+            
+            # Process and return structured data
+            return {
+                "url": pr_url,
+                "number": pr["number"],
+                "title": pr["title"],
+                "body": pr["body"] or "",
+                "state": "open" if pr["state"] == "OPEN" else "closed",
+                "author": author["login"] if author else "ghost",
+                "created_at": pr["createdAt"],
+                "updated_at": pr["updatedAt"],
+                "base_branch": pr["baseRefName"],
+                "head_branch": pr["headRefName"],
+                "head_sha": pr["headRefOid"],
+                "base_sha": pr["baseRefOid"],
+                "repository": f"{owner}/{repo}",
+                "files_changed": pr["changedFiles"],
+                "additions": pr["additions"],
+                "deletions": pr["deletions"],
+                "draft": pr["isDraft"],
+                "mergeable": _MERGEABLE.get(pr["mergeable"]),
+                "merged": pr["merged"],
+                "html_url": html_url,
+                "diff_url": f"{html_url}.diff",
+                "labels": pr["labels"]["nodes"],
+                "comments": pr["comments"]["totalCount"],
+                # Individual review comments, as REST's review_comments counted
+                # them; GraphQL only counts threads, so sum their comments
+                # (threads beyond the first 100 are not counted)
+                "review_comments": sum(
+                    thread["comments"]["totalCount"] for thread in pr["reviewThreads"]["nodes"]
+                ),
+                "changed_files": [
+                    {
+                        "filename": file["filename"],
+                        "status": file["status"],
+                        "additions": file["additions"],
+                        "deletions": file["deletions"],
+                        "patch": patch[:MAX_PATCH_CHARS] if (patch := file.get("patch")) else ""
+                    }
+                    for file in islice(files_data, MAX_FILES)
+                ],
+                "commits": [
+                    self._commit_details(node["commit"])
+                    for node in pr["commits"]["nodes"]  # Last 10 commits
+                ]
+            }
+            
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise GitHubServiceError(f"PR not found: {pr_url}")
+            elif e.response.status_code == 403:
+                raise GitHubServiceError("GitHub API access denied. Check token permissions.")
+            else:
+                raise GitHubServiceError(f"GitHub API error: {e.response.status_code}")
+        except httpx.RequestError as e:
+            raise GitHubServiceError(f"GitHub API request failed: {str(e)}")
+    
+    @staticmethod
+    def _commit_details(commit: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL commit node to the REST-style commit dict."""
+        # Commit.author is nullable, e.g. for commits with a malformed signature
+        author = commit["author"] or {}
+        return {
+            "sha": commit["oid"],
+            "message": commit["message"],
+            "author": author.get("name") or "ghost",
+            "date": author.get("date")
+        }
+    
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the concurrency gate, honoring rate limits.
+        
+        Transient failures (connection errors, 429 and 5xx, or a 403 carrying
+        Retry-After from the secondary rate limit) are retried with jittered
+        exponential backoff, or after the advertised Retry-After delay. Other
+        statuses are returned for the caller to handle.
+        
+        URLs are API paths; they are sent absolute with the service's auth
+        headers, since the client may be shared with other integrations.
+        """
+        url = self.base_url + url
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            delay = self._paused_until - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, url, **kwargs)
+            except httpx.RequestError as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(
+                    "GitHub request failed, retrying",
+                    extra={"error": str(e), "attempt": attempt, "delay_seconds": round(delay, 2)}
                 )
-                files_response.raise_for_status()
-                files_data = files_response.json()
-                
-                # Get commits
-                commits_response = await client.get(
-                    f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/commits",
-                    headers=self.headers,
-                    timeout=30.0
+                await asyncio.sleep(delay)
+                continue
+            
+            self._track_rate_limit(response)
+            
+            status = response.status_code
+            retry_after = response.headers.get("Retry-After")
+            retryable = status in _RETRY_STATUSES or (status == 403 and retry_after is not None)
+            if not retryable or attempt == self.MAX_ATTEMPTS:
+                return response
+            
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.warning(
+                "GitHub returned a transient error, retrying",
+                extra={"status": status, "attempt": attempt, "delay_seconds": round(delay, 2)}
+            )
+            await asyncio.sleep(delay)
+        
+        return response
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number ``attempt``."""
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.RATE_LIMIT_MAX_WAIT_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        
+        base = min(self.RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1), self.RETRY_MAX_DELAY_SECONDS)
+        return base + random.uniform(0, base)
+    
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Pause new requests when the rate-limit window is nearly spent."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None or int(remaining) > self.RATE_LIMIT_LOW_WATER:
+            return
+        
+        now = time.time()
+        self._paused_until = min(float(reset), now + self.RATE_LIMIT_MAX_WAIT_SECONDS)
+        logger.warning(
+            "GitHub rate limit nearly exhausted, pausing requests",
+            extra={"remaining": int(remaining), "wait_seconds": round(self._paused_until - now, 1)}
+        )
+    
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GitHub GraphQL query and return its ``data`` payload."""
+        response = await self._send(
+            "POST",
+            "/graphql",
+            json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        
+        errors = payload.get("errors")
+        if errors:
+            # A missing repository or PR comes back as a NOT_FOUND error with
+            # a null node; let the caller report that as a missing PR
+            if all(error.get("type") == "NOT_FOUND" for error in errors):
+                return payload.get("data") or {}
+            raise GitHubServiceError(f"GitHub GraphQL error: {errors[0].get('message', 'unknown error')}")
+        
+        return payload["data"]
+    
+    async def _get_json(self, url: str) -> Any:
+        """GET a GitHub API path and return the decoded JSON body.
+        
+        Sends If-None-Match when a previous response for the URL is cached
+        and reuses that body on 304 Not Modified. The body is parsed straight
+        from the raw bytes, so large responses such as the files listing are
+        never copied through a decoded str.
+        """
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        
+        response = await self._send("GET", url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache.move_to_end(url)
+            return cached[1]
+        
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, data)
+            self._etag_cache.move_to_end(url)
+            if len(self._etag_cache) > self.ETAG_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+                logger.debug(
+                    "GitHub ETag cache full, evicted oldest entry",
+                    extra={"size": len(self._etag_cache)}
                 )
-                commits_response.raise_for_status()
-                commits_data = commits_response.json()
-                
-                # Process and return structured data
-                return {
-                    "url": pr_url,
-                    "number": pr_data["number"],
-                    "title": pr_data["title"],
-                    "body": pr_data["body"] or "",
-                    "state": pr_data["state"],
-                    "author": pr_data["user"]["login"],
-                    "created_at": pr_data["created_at"],
-                    "updated_at": pr_data["updated_at"],
-                    "base_branch": pr_data["base"]["ref"],
-                    "head_branch": pr_data["head"]["ref"],
-                    "head_sha": pr_data["head"]["sha"],
-                    "base_sha": pr_data["base"]["sha"],
-                    "repository": f"{owner}/{repo}",
-                    "files_changed": len(files_data),
-                    "additions": pr_data["additions"],
-                    "deletions": pr_data["deletions"],
-                    "draft": pr_data.get("draft", False),
-                    "mergeable": pr_data.get("mergeable"),
-                    "merged": pr_data.get("merged", False),
-                    "html_url": pr_data["html_url"],
-                    "diff_url": pr_data.get("diff_url", f"{pr_data['html_url']}.diff"),
-                    "labels": pr_data.get("labels", []),
-                    "comments": pr_data.get("comments", 0),
-                    "review_comments": pr_data.get("review_comments", 0),
-                    "changed_files": [
-                        {
-                            "filename": file["filename"],
-                            "status": file["status"],
-                            "additions": file["additions"],
-                            "deletions": file["deletions"],
-                            "patch": file.get("patch", "")[:1000]  # Limit patch size
-                        }
-                        for file in files_data[:20]  # Limit number of files
-                    ],
-                    "commits": [
-                        {
-                            "sha": commit["sha"],
-                            "message": commit["commit"]["message"],
-                            "author": commit["commit"]["author"]["name"],
-                            "date": commit["commit"]["author"]["date"]
-                        }
-                        for commit in commits_data[-10:]  # Last 10 commits
-                    ]
-                }
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise GitHubServiceError(f"PR not found: {pr_url}")
-                elif e.response.status_code == 403:
-                    raise GitHubServiceError("GitHub API access denied. Check token permissions.")
-                else:
-                    raise GitHubServiceError(f"GitHub API error: {e.response.status_code}")
-            except httpx.RequestError as e:
-                raise GitHubServiceError(f"GitHub API request failed: {str(e)}")
+        
+        return data
+    
+    def etag_cache_size(self) -> int:
+        """Number of responses held in the ETag cache."""
+        return len(self._etag_cache)
     
     def _extract_pr_info(self, pr_url: str) -> tuple[str, str, str]:
         """Extract owner, repo, and PR number from GitHub URL."""
-        match = re.match(r'https://github\.com/([^/]+)/([^/]+)/pull/(\d+)', pr_url.rstrip('/'))
-        if not match:
+        match = _PR_URL_RE.match(pr_url)
+        if match is None:
             raise GitHubValidationError(f"Invalid GitHub PR URL format: {pr_url}")
         return match.groups()
     
     def _is_valid_github_pr_url(self, url: str) -> bool:
         """Validate GitHub PR URL format."""
-        pattern = r'^https://github\.com/[^/]+/[^/]+/pull/\d+$'
-        return bool(re.match(pattern, url))
\ No newline at end of file
+        return _PR_URL_RE.match(url) is not None
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client, unless it was injected by the caller."""
+        if self._owns_client:
+            await self._client.aclose()
+
+
+@functools.lru_cache(maxsize=1)
+def get_github_service() -> GitHubService:
+    """Get the shared GitHub service instance.
+    
+    The service's AsyncClient is safe to use from concurrent coroutines, so
+    one instance serves the whole process, sharing the process-wide
+    connection pool with the other integrations.
+    """
+    return GitHubService(http_client=get_http_client())
+
+
+async def close_github_service() -> None:
+    """Close the shared GitHub service, if one was created."""
+    if get_github_service.cache_info().currsize:
+        await get_github_service().aclose()
+        get_github_service.cache_clear()
@@ -0,0 +1,41 @@
+"""Shared HTTP client for outbound API calls.
+
+One pooled AsyncClient serves every integration in the process, so GitHub
+and Jira requests reuse keep-alive connections and TLS sessions instead of
+each service holding a pool of its own.
+"""
+
+import functools
+
+import httpx
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client suitable for sharing between services.
+
+    The client carries no base URL or credentials; services send absolute
+    URLs and their own auth headers with each request.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=300
+        ),
+        headers={"User-Agent": "PR-Summarizer/1.0"}
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client."""
+    return create_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client, if one was created."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
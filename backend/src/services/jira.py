@@ -1,8 +1,26 @@
 """Jira service for interacting with Jira API."""
 
-from typing import Dict, Any
+import asyncio
+import functools
+import os
+from typing import Dict, Any, List, Optional
 import re
 
+import httpx
+
+from src.services.http_client import get_http_client
+
+
+# Jira ticket key: PROJ-123
+_JIRA_RE = re.compile(r'^[A-Z][A-Z0-9]+-\d+$')
+
+# Issue fields requested from Jira; everything create_jira_context reads
+_TICKET_FIELDS = [
+    "summary", "description", "status", "priority", "issuetype",
+    "assignee", "reporter", "created", "updated", "project",
+    "components", "labels",
+]
+
 
 class JiraServiceError(Exception):
     """Base exception for Jira service errors."""
@@ -17,19 +35,148 @@ class JiraValidationError(JiraServiceError):
 class JiraService:
     """Service for Jira API operations."""
     
-    def __init__(self, server_url: str = None, username: str = None, api_token: str = None):
-        """Initialize Jira service."""
-        self.server_url = server_url
-        self.username = username
-        self.api_token = api_token
+    # Search endpoint; v2 returns descriptions as plain text rather than
+    # Atlassian Document Format
+    SEARCH_PATH = "/rest/api/2/search"
+    
+    # Jira's default search page size; larger lookups are split into chunks
+    BULK_CHUNK_SIZE = 50
+    
+    def __init__(
+        self,
+        server_url: str = None,
+        username: str = None,
+        api_token: str = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        """Initialize Jira service.
         
+        Args:
+            server_url: Jira base URL; defaults to JIRA_SERVER
+            username: Jira account; defaults to JIRA_USERNAME
+            api_token: Jira API token; defaults to JIRA_API_TOKEN
+            http_client: Client to share with other services. The caller keeps
+                ownership and closes it; by default the service creates its own.
+        """
+        self.server_url = server_url or os.getenv('JIRA_SERVER')
+        self.username = username or os.getenv('JIRA_USERNAME')
+        self.api_token = api_token or os.getenv('JIRA_API_TOKEN')
+        
+        # Pooled client: the injected one, or our own created on first request
+        self._owns_client = http_client is None
+        self._client: Optional[httpx.AsyncClient] = http_client
+    
+    @property
+    def is_configured(self) -> bool:
+        """Whether server URL and credentials are all set."""
+        return bool(self.server_url and self.username and self.api_token)
+    
     async def get_ticket_details(self, ticket_id: str) -> Dict[str, Any]:
         """Get ticket details from Jira API."""
+        tickets = await self.get_tickets_batch([ticket_id])
+        ticket = tickets.get(ticket_id)
+        if ticket is None:
+            raise JiraServiceError(f"Ticket not found: {ticket_id}")
+        return ticket
+    
+    async def get_tickets_batch(self, ticket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several tickets with a single JQL search.
+        
+        Args:
+            ticket_ids: Jira ticket keys
+        
+        Returns:
+            Ticket data keyed by ticket key; keys Jira doesn't return are absent
+        """
         # Validate ticket ID format first
-        if not self._is_valid_ticket_id(ticket_id):
-            raise JiraValidationError(f"Invalid Jira ticket ID format: {ticket_id}")
+        for ticket_id in ticket_ids:
+            if not self._is_valid_ticket_id(ticket_id):
+                raise JiraValidationError(f"Invalid Jira ticket ID format: {ticket_id}")
+        
+        if not ticket_ids:
+            return {}
         
-        # Temporary stub for TDD - simulate successful response for valid ticket IDs
+        if not self.is_configured:
+            # No Jira instance configured - simulate successful responses so
+            # the summary flow still works in development
+            return {ticket_id: self._mock_ticket(ticket_id) for ticket_id in ticket_ids}
+        
+        try:
+            # Absolute URL and per-request auth, so a shared client without
+            # Jira's base URL or credentials works too
+            response = await self._get_client().post(
+                self.server_url.rstrip('/') + self.SEARCH_PATH,
+                auth=(self.username, self.api_token),
+                headers={"Accept": "application/json"},
+                json={
+                    "jql": f"key in ({','.join(ticket_ids)})",
+                    "fields": _TICKET_FIELDS,
+                    "maxResults": len(ticket_ids)
+                }
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                raise JiraServiceError("Jira API access denied. Check credentials.")
+            elif e.response.status_code == 400:
+                # JQL naming a missing issue key is rejected outright
+                raise JiraServiceError(f"Jira rejected ticket lookup: {', '.join(ticket_ids)}")
+            else:
+                raise JiraServiceError(f"Jira API error: {e.response.status_code}")
+        except httpx.RequestError as e:
+            raise JiraServiceError(f"Jira API request failed: {str(e)}")
+        
+        return {issue["key"]: issue for issue in response.json().get("issues", [])}
+    
+    async def get_tickets_bulk(self, ticket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get any number of tickets with as few JQL searches as possible.
+        
+        Duplicate keys are fetched once; the keys are split into chunks of
+        ``BULK_CHUNK_SIZE`` searched concurrently, one request per chunk.
+        
+        Args:
+            ticket_ids: Jira ticket keys
+        
+        Returns:
+            Ticket data keyed by ticket key; keys Jira doesn't return are absent
+        """
+        unique_ids = list(dict.fromkeys(ticket_ids))
+        chunks = [
+            unique_ids[i:i + self.BULK_CHUNK_SIZE]
+            for i in range(0, len(unique_ids), self.BULK_CHUNK_SIZE)
+        ]
+        
+        tickets: Dict[str, Dict[str, Any]] = {}
+        for found in await asyncio.gather(*(self.get_tickets_batch(chunk) for chunk in chunks)):
+            tickets.update(found)
+        return tickets
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.server_url,
+                auth=(self.username, self.api_token),
+                http2=True,
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=300
+                ),
+                headers={"Accept": "application/json", "User-Agent": "PR-Summarizer/1.0"}
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client, if this service created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @staticmethod
+    def _mock_ticket(ticket_id: str) -> Dict[str, Any]:
+        """Placeholder ticket used when no Jira instance is configured."""
         return {
             "key": ticket_id,
             "fields": {
@@ -44,5 +191,17 @@ class JiraService:
     
     def _is_valid_ticket_id(self, ticket_id: str) -> bool:
         """Validate Jira ticket ID format (e.g., PROJ-123)."""
-        pattern = r'^[A-Z][A-Z0-9]+-\d+$'
-        return bool(re.match(pattern, ticket_id))
\ No newline at end of file
+        return _JIRA_RE.match(ticket_id) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_jira_service() -> JiraService:
+    """Get the shared Jira service instance, on the process-wide HTTP client."""
+    return JiraService(http_client=get_http_client())
+
+
+async def close_jira_service() -> None:
+    """Close the shared Jira service, if one was created."""
+    if get_jira_service.cache_info().currsize:
+        await get_jira_service().aclose()
+        get_jira_service.cache_clear()
\ No newline at end of file
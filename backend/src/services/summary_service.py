@@ -6,10 +6,16 @@ to generate comprehensive PR summaries with proper error handling and performanc
 """
 
 import asyncio
+import logging
+import os
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from uuid import uuid4
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Any, Hashable, Mapping, Optional, List, Union
+from uuid import UUID
+
+import httpx
 
 from src.models.context import (
     IntegrationContext, 
@@ -22,9 +28,10 @@ from src.models.context import (
 )
 from src.models.pr_summary import PRSummary, ProcessingStatus
 from src.models.request import SummaryRequest, extract_github_info, normalize_jira_ticket_id
-from src.services.github import GitHubService, GitHubValidationError
-from src.services.jira import JiraService, JiraValidationError
+from src.services.github import GitHubService, GitHubValidationError, get_github_service
+from src.services.jira import JiraService, JiraValidationError, get_jira_service
 from src.services.gemini import GeminiService
+from src.services.cache import TTLCache, memoized_fetch
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +52,44 @@ class SummaryGenerationError(SummaryOrchestrationError):
     pass
 
 
+# How long retrieved Jira contexts are reused. PR details are cached by
+# GitHubService itself, where ETag revalidation also happens.
+JIRA_CACHE_TTL_SECONDS = 60
+
+
+def _new_integration_id() -> str:
+    """Generate a time-ordered UUID (version 7) for an integration.
+    
+    IDs sort by creation time, so they index well once persisted: 48 bits of
+    Unix milliseconds followed by 74 random bits.
+    """
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (time.time_ns() // 1_000_000) << 80
+        | 0x7 << 76                          # version
+        | (rand >> 68) << 64                 # 12 random bits
+        | 0b10 << 62                         # RFC 4122 variant
+        | rand & ((1 << 62) - 1)             # 62 random bits
+    )
+    return str(UUID(int=value))
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds since a ``time.perf_counter_ns()`` reading."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+def _mark_cache_hit(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached retrieval result, flagging its metadata as a cache hit."""
+    metadata = result['metadata'].model_copy(update={'cache_hit': True, 'response_time_ms': 0})
+    return {
+        **result,
+        'data': result['data'].model_copy(update={'metadata': metadata}),
+        'metadata': metadata,
+        'response_time_ms': 0
+    }
+
+
 class SummaryOrchestrationService:
     """
     Core orchestration service for PR summary generation.
@@ -53,11 +98,19 @@ class SummaryOrchestrationService:
     to create comprehensive, context-rich PR summaries.
     """
     
+    # Upper bound on each dependency's health check
+    HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+    
+    # AI inputs prepared from contexts, reused while the source is unchanged
+    PREPARED_DATA_CACHE_MAX_ENTRIES = 512
+    PREPARED_DATA_CACHE_TTL_SECONDS = 3600
+    
     def __init__(
         self,
         github_service: Optional[GitHubService] = None,
         jira_service: Optional[JiraService] = None,
-        gemini_service: Optional[GeminiService] = None
+        gemini_service: Optional[GeminiService] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize the orchestration service.
@@ -66,25 +119,76 @@ class SummaryOrchestrationService:
             github_service: GitHub integration service
             jira_service: Jira integration service  
             gemini_service: AI summary generation service
+            http_client: Client for services created here to share. Without
+                one, the process-wide GitHub and Jira services are used.
         """
-        self.github_service = github_service or GitHubService()
-        self.jira_service = jira_service or JiraService()
+        # Services built here are closed on exit; injected ones are not
+        self._owned_services: List[Union[GitHubService, JiraService]] = []
+        
+        if github_service is None:
+            if http_client is not None:
+                github_service = GitHubService(http_client=http_client)
+                self._owned_services.append(github_service)
+            else:
+                github_service = get_github_service()
+        
+        if jira_service is None:
+            if http_client is not None:
+                jira_service = JiraService(http_client=http_client)
+                self._owned_services.append(jira_service)
+            else:
+                jira_service = get_jira_service()
+        
+        self.github_service = github_service
+        self.jira_service = jira_service
         self.gemini_service = gemini_service or GeminiService()
         
-        # Performance tracking
-        self.performance_metrics = {}
+        # Performance tracking: running totals, so reads are O(1) and memory
+        # stays constant however many summaries are generated
+        self._total_count = 0
+        self._success_count = 0
+        self._total_time_ns = 0
+        self._started_ns = time.perf_counter_ns()
+        
+        # (PR URL, ticket, options) -> summary generation in flight
+        self._inflight: Dict[Hashable, "asyncio.Future[PRSummary]"] = {}
+        
+        # (kind, content key) -> read-only AI input built from that content
+        self._prepared_data_cache = TTLCache(
+            self.PREPARED_DATA_CACHE_MAX_ENTRIES,
+            self.PREPARED_DATA_CACHE_TTL_SECONDS
+        )
+    
+    async def __aenter__(self) -> "SummaryOrchestrationService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the services this orchestrator created."""
+        for service in self._owned_services:
+            await service.aclose()
+        self._owned_services.clear()
         
     async def generate_summary(
         self, 
         request: SummaryRequest,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        *,
+        jira_prefetch: Optional[Awaitable[Mapping[str, Dict[str, Any]]]] = None
     ) -> PRSummary:
         """
         Generate a comprehensive PR summary from the given request.
         
+        Concurrent calls with the same request and options share a single
+        run of the pipeline.
+        
         Args:
             request: Summary generation request
             options: Optional configuration parameters
+            jira_prefetch: Bulk-retrieved Jira results to use before falling
+                back to retrieving the ticket on its own
             
         Returns:
             Generated PR summary
@@ -92,69 +196,174 @@ class SummaryOrchestrationService:
         Raises:
             SummaryOrchestrationError: If summary generation fails
         """
-        start_time = time.time()
-        integration_id = str(uuid4())
+        try:
+            key = (
+                request.github_pr_url,
+                request.jira_ticket_id,
+                tuple(sorted(options.items())) if options else ()
+            )
+            hash(key)
+        except TypeError:
+            # Options with unhashable values can't be matched; run on our own
+            return await self._generate_summary(request, options, jira_prefetch)
+        
+        # Identical requests already in flight share one pipeline run
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_summary(request, options, jira_prefetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield the shared run so one cancelled caller doesn't cancel it for
+        # everyone else waiting on the same summary
+        summary = await asyncio.shield(task)
+        return summary.model_copy()
+    
+    async def _generate_summary(
+        self,
+        request: SummaryRequest,
+        options: Optional[Dict[str, Any]] = None,
+        jira_prefetch: Optional[Awaitable[Mapping[str, Dict[str, Any]]]] = None
+    ) -> PRSummary:
+        """Run the summary pipeline for one request; see generate_summary."""
+        start_ns = time.perf_counter_ns()
+        integration_id = _new_integration_id()
+        log = logger.bind(integration_id=integration_id)
         
-        logger.info(
+        log.info(
             "Starting summary generation",
-            extra={
-                "integration_id": integration_id,
-                "github_pr_url": request.github_pr_url,
-                "jira_ticket_id": request.jira_ticket_id
-            }
+            github_pr_url=request.github_pr_url,
+            jira_ticket_id=request.jira_ticket_id
         )
         
         try:
             # Step 1: Build integration context
-            context = await self._build_integration_context(request, integration_id)
+            context = await self._build_integration_context(request, integration_id, jira_prefetch)
             
-            # Step 2: Prepare options with original URL
-            enhanced_options = options.copy() if options else {}
-            enhanced_options['github_pr_url'] = request.github_pr_url
+            # Step 2: Overlay the original URL on the options without copying them
+            enhanced_options = ChainMap({'github_pr_url': request.github_pr_url}, options or {})
             
             # Step 3: Generate AI summary using integrated context
             summary = await self._generate_ai_summary(context, enhanced_options)
             
             # Step 3: Calculate processing time
-            processing_time = int((time.time() - start_time) * 1000)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = elapsed_ns // 1_000_000
             summary.processing_time_ms = processing_time
+            self._record_summary(elapsed_ns, success=True)
             
-            logger.info(
+            log.info(
                 "Summary generation completed successfully",
-                extra={
-                    "integration_id": integration_id,
-                    "summary_id": summary.id,
-                    "processing_time_ms": processing_time,
-                    "completeness_score": context.completeness_score
-                }
+                summary_id=summary.id,
+                processing_time_ms=processing_time,
+                completeness_score=context.completeness_score
             )
             
             return summary
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            processing_time = elapsed_ns // 1_000_000
+            self._record_summary(elapsed_ns, success=False)
             
-            logger.error(
+            log.error(
                 "Summary generation failed",
-                extra={
-                    "integration_id": integration_id,
-                    "error": str(e),
-                    "processing_time_ms": processing_time
-                }
+                error=str(e),
+                processing_time_ms=processing_time
             )
             
             # Re-raise with context
             if isinstance(e, (GitHubValidationError, JiraValidationError)):
-                raise e
+                raise
             elif isinstance(e, SummaryOrchestrationError):
-                raise e
+                raise
             else:
-                raise SummaryOrchestrationError(f"Summary generation failed: {str(e)}")
+                raise SummaryOrchestrationError(f"Summary generation failed: {str(e)}") from e
+    
+    async def generate_summaries_batch(
+        self,
+        requests: List[SummaryRequest],
+        max_concurrency: int = 8
+    ) -> List[Union[PRSummary, BaseException]]:
+        """
+        Generate summaries for several PRs, overlapping their network time.
+        
+        Each request runs through generate_summary, at most
+        ``max_concurrency`` at once. Every referenced Jira ticket is fetched
+        up front in one bulk lookup that the individual runs draw on.
+        
+        Args:
+            requests: Summary generation requests
+            max_concurrency: Maximum summaries generated concurrently
+            
+        Returns:
+            One entry per request, in order: the generated summary, or the
+            exception that stopped it
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        jira_prefetch = asyncio.create_task(self._prefetch_jira_data(requests))
+        
+        async def generate_one(request: SummaryRequest) -> PRSummary:
+            async with semaphore:
+                return await self.generate_summary(request, jira_prefetch=jira_prefetch)
+        
+        try:
+            results = await asyncio.gather(
+                *(generate_one(request) for request in requests),
+                return_exceptions=True
+            )
+        finally:
+            # Only still running if no request needed Jira data
+            jira_prefetch.cancel()
+        
+        logger.info(
+            "Batch summary generation completed",
+            requested=len(requests),
+            succeeded=sum(1 for r in results if isinstance(r, PRSummary))
+        )
+        
+        return results
+    
+    async def _prefetch_jira_data(
+        self,
+        requests: List[SummaryRequest]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the Jira tickets referenced by several requests in bulk.
+        
+        Prefetching is best effort: invalid ticket IDs are skipped and a
+        failed lookup yields no results, leaving each request to retrieve its
+        own ticket and report its own error.
+        
+        Args:
+            requests: Summary requests
+            
+        Returns:
+            Jira retrieval results keyed by normalized ticket ID
+        """
+        ticket_ids = []
+        for request in requests:
+            try:
+                ticket_id = normalize_jira_ticket_id(request.jira_ticket_id)
+            except ValueError:
+                continue
+            if ticket_id:
+                ticket_ids.append(ticket_id)
+        
+        if not ticket_ids:
+            return {}
+        
+        try:
+            return await self._retrieve_jira_data_bulk(ticket_ids)
+        except Exception as e:
+            logger.warning("Bulk Jira prefetch failed", error=str(e))
+            return {}
     
     async def _build_integration_context(
         self, 
         request: SummaryRequest, 
-        integration_id: str
+        integration_id: str,
+        jira_prefetch: Optional[Awaitable[Mapping[str, Dict[str, Any]]]] = None
     ) -> IntegrationContext:
         """
         Build comprehensive integration context from multiple sources.
@@ -162,82 +371,93 @@ class SummaryOrchestrationService:
         Args:
             request: Summary request
             integration_id: Unique integration identifier
+            jira_prefetch: Bulk-retrieved Jira results to use before falling
+                back to retrieving the ticket on its own
             
         Returns:
             Integration context with all available data
         """
-        logger.info(
-            "Building integration context",
-            extra={"integration_id": integration_id}
-        )
-        
-        # Prepare data retrieval tasks
-        tasks = {}
+        log = logger.bind(integration_id=integration_id)
+        log.info("Building integration context")
         
-        # Always retrieve GitHub data (required)
-        tasks['github'] = self._retrieve_github_data(request.github_pr_url)
+        normalized_ticket_id = (
+            normalize_jira_ticket_id(request.jira_ticket_id) if request.jira_ticket_id else None
+        )
         
-        # Conditionally retrieve Jira data
-        if request.jira_ticket_id:
-            normalized_ticket_id = normalize_jira_ticket_id(request.jira_ticket_id)
-            if normalized_ticket_id:
-                tasks['jira'] = self._retrieve_jira_data(normalized_ticket_id)
+        # Retrieve both sources concurrently. Jira failures are absorbed by
+        # its task, so only a GitHub failure can fail the group - which then
+        # cancels the Jira request instead of waiting for it
+        jira_task = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                github_task = tg.create_task(self._retrieve_github_data(request.github_pr_url))
+                if normalized_ticket_id:
+                    jira_task = tg.create_task(
+                        self._retrieve_optional_jira_data(
+                            normalized_ticket_id, integration_id, jira_prefetch
+                        )
+                    )
+        except BaseExceptionGroup as eg:
+            # Surface the GitHub error itself, as callers expect
+            raise eg.exceptions[0]
         
-        # Execute data retrieval tasks concurrently
-        results = await self._execute_concurrent_tasks(tasks)
+        github_result = github_task.result()
+        jira_result = jira_task.result() if jira_task is not None else None
         
         # Build context from results
         context = IntegrationContext(
             integration_id=integration_id,
-            github=results['github']['data'],
-            jira=results.get('jira', {}).get('data'),
+            github=github_result['data'],
+            jira=jira_result['data'] if jira_result is not None else None,
             created_at=datetime.now()
         )
         
         # Calculate data quality scores
         context.completeness_score = context.calculate_completeness_score()
-        context.confidence_score = self._calculate_confidence_score(context, results)
-        
-        logger.info(
-            "Integration context built successfully",
-            extra={
-                "integration_id": integration_id,
-                "available_sources": [s.value for s in context.get_available_sources()],
-                "completeness_score": context.completeness_score,
-                "confidence_score": context.confidence_score
-            }
+        context.confidence_score = self._calculate_confidence_score(
+            context, github_result, jira_result
         )
         
+        if log.is_enabled_for(logging.INFO):
+            log.info(
+                "Integration context built successfully",
+                available_sources=[s.value for s in context.get_available_sources()],
+                completeness_score=context.completeness_score,
+                confidence_score=context.confidence_score
+            )
+        
         return context
     
     async def _retrieve_github_data(self, github_url: str) -> Dict[str, Any]:
         """Retrieve GitHub PR data with error handling and metadata tracking."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validate URL and extract information
             owner, repo, pr_number = extract_github_info(github_url)
             
-            logger.debug(
-                "Retrieving GitHub data",
-                extra={
-                    "github_url": github_url,
-                    "owner": owner,
-                    "repo": repo,
-                    "pr_number": pr_number
-                }
-            )
-            
-            # Retrieve PR data
-            pr_data = await self.github_service.get_pr_details(github_url)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Retrieving GitHub data",
+                    github_url=github_url,
+                    owner=owner,
+                    repo=repo,
+                    pr_number=pr_number
+                )
+            
+            # Retrieve PR data, from the service's cache when it is fresh
+            pr_data = self.github_service.cached_pr_details(github_url)
+            cache_hit = pr_data is not None
+            if not cache_hit:
+                pr_data = await self.github_service.get_pr_details(github_url)
             
             # Create metadata
-            response_time = int((time.time() - start_time) * 1000)
+            response_time = _elapsed_ms(start_ns)
             metadata = SourceMetadata(
                 source=DataSource.GITHUB,
-                retrieved_at=datetime.now(),
+                retrieved_at_ns=time.time_ns(),
                 response_time_ms=response_time,
-                cache_hit=False  # TODO: Implement caching
+                cache_hit=cache_hit
             )
             
             # Create structured context
@@ -253,39 +473,90 @@ class SummaryOrchestrationService:
         except GitHubValidationError:
             raise  # Re-raise validation errors as-is
         except Exception as e:
-            response_time = int((time.time() - start_time) * 1000)
+            response_time = _elapsed_ms(start_ns)
             
             logger.error(
                 "GitHub data retrieval failed",
-                extra={
-                    "github_url": github_url,
-                    "error": str(e),
-                    "response_time_ms": response_time
-                }
+                github_url=github_url,
+                error=str(e),
+                response_time_ms=response_time
             )
             
-            raise DataRetrievalError(f"GitHub data retrieval failed: {str(e)}")
+            raise DataRetrievalError(f"GitHub data retrieval failed: {str(e)}") from e
+    
+    async def _retrieve_optional_jira_data(
+        self,
+        ticket_id: str,
+        integration_id: str,
+        jira_prefetch: Optional[Awaitable[Mapping[str, Dict[str, Any]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve Jira data, logging a failure and returning None instead."""
+        try:
+            if jira_prefetch is not None:
+                result = (await jira_prefetch).get(ticket_id)
+                if result is not None:
+                    return result
+            return await self._retrieve_jira_data(ticket_id)
+        except Exception as e:
+            logger.warning(
+                "Jira data retrieval failed",
+                integration_id=integration_id,
+                task="jira",
+                error=str(e)
+            )
+            return None
     
+    async def _retrieve_jira_data_bulk(self, ticket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several Jira tickets in bulk, keyed by ticket ID.
+        
+        Tickets Jira doesn't return are absent from the result.
+        """
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            tickets = await self.jira_service.get_tickets_bulk(ticket_ids)
+        except JiraValidationError:
+            raise  # Re-raise validation errors as-is
+        except Exception as e:
+            raise DataRetrievalError(f"Jira bulk retrieval failed: {str(e)}") from e
+        
+        # The lookup was shared, so every ticket carries its timing
+        response_time = _elapsed_ms(start_ns)
+        metadata = SourceMetadata(
+            source=DataSource.JIRA,
+            retrieved_at_ns=time.time_ns(),
+            response_time_ms=response_time,
+            cache_hit=False
+        )
+        
+        return {
+            ticket_id: {
+                'success': True,
+                'data': create_jira_context(ticket_data, metadata),
+                'metadata': metadata,
+                'response_time_ms': response_time
+            }
+            for ticket_id, ticket_data in tickets.items()
+        }
+    
+    @memoized_fetch(ttl=JIRA_CACHE_TTL_SECONDS, on_hit=_mark_cache_hit)
     async def _retrieve_jira_data(self, ticket_id: str) -> Dict[str, Any]:
         """Retrieve Jira ticket data with error handling and metadata tracking."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            logger.debug(
-                "Retrieving Jira data",
-                extra={"ticket_id": ticket_id}
-            )
+            logger.debug("Retrieving Jira data", ticket_id=ticket_id)
             
             # Retrieve ticket data
             ticket_data = await self.jira_service.get_ticket_details(ticket_id)
             
             # Create metadata
-            response_time = int((time.time() - start_time) * 1000)
+            response_time = _elapsed_ms(start_ns)
             metadata = SourceMetadata(
                 source=DataSource.JIRA,
-                retrieved_at=datetime.now(),
+                retrieved_at_ns=time.time_ns(),
                 response_time_ms=response_time,
-                cache_hit=False  # TODO: Implement caching
+                cache_hit=False
             )
             
             # Create structured context
@@ -301,69 +572,21 @@ class SummaryOrchestrationService:
         except JiraValidationError:
             raise  # Re-raise validation errors as-is
         except Exception as e:
-            response_time = int((time.time() - start_time) * 1000)
+            response_time = _elapsed_ms(start_ns)
             
             logger.error(
                 "Jira data retrieval failed",
-                extra={
-                    "ticket_id": ticket_id,
-                    "error": str(e),
-                    "response_time_ms": response_time
-                }
+                ticket_id=ticket_id,
+                error=str(e),
+                response_time_ms=response_time
             )
             
-            raise DataRetrievalError(f"Jira data retrieval failed: {str(e)}")
-    
-    async def _execute_concurrent_tasks(
-        self, 
-        tasks: Dict[str, Any]
-    ) -> Dict[str, Dict[str, Any]]:
-        """
-        Execute multiple data retrieval tasks concurrently with error isolation.
-        
-        Args:
-            tasks: Dictionary of task names to coroutines
-            
-        Returns:
-            Dictionary of results with error handling
-        """
-        results = {}
-        
-        # Execute tasks concurrently
-        task_results = await asyncio.gather(
-            *tasks.values(),
-            return_exceptions=True
-        )
-        
-        # Process results
-        for task_name, result in zip(tasks.keys(), task_results):
-            if isinstance(result, Exception):
-                # Handle task failure
-                if task_name == 'github':
-                    # GitHub is required - re-raise the error
-                    raise result
-                else:
-                    # Optional tasks - log error but continue
-                    logger.warning(
-                        f"{task_name.title()} data retrieval failed",
-                        extra={
-                            "task": task_name,
-                            "error": str(result)
-                        }
-                    )
-                    results[task_name] = {
-                        'success': False,
-                        'error': str(result)
-                    }
-            else:
-                results[task_name] = result
-        
-        return results
+            raise DataRetrievalError(f"Jira data retrieval failed: {str(e)}") from e
     
     async def _generate_ai_summary(
         self, 
         context: IntegrationContext, 
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Mapping[str, Any]] = None
     ) -> PRSummary:
         """
         Generate AI-powered summary from integration context.
@@ -375,13 +598,12 @@ class SummaryOrchestrationService:
         Returns:
             Generated PR summary
         """
-        logger.info(
-            "Generating AI summary",
-            extra={
-                "integration_id": context.integration_id,
-                "available_sources": [s.value for s in context.get_available_sources()]
-            }
-        )
+        log = logger.bind(integration_id=context.integration_id)
+        if log.is_enabled_for(logging.INFO):
+            log.info(
+                "Generating AI summary",
+                available_sources=[s.value for s in context.get_available_sources()]
+            )
         
         try:
             # Prepare data for AI service
@@ -397,29 +619,41 @@ class SummaryOrchestrationService:
                 options=options
             )
             
-            logger.info(
+            log.info(
                 "AI summary generated successfully",
-                extra={
-                    "integration_id": context.integration_id,
-                    "summary_id": summary.id
-                }
+                summary_id=summary.id
             )
             
             return summary
             
         except Exception as e:
-            logger.error(
+            log.error(
                 "AI summary generation failed",
-                extra={
-                    "integration_id": context.integration_id,
-                    "error": str(e)
-                }
+                error=str(e)
             )
             
-            raise SummaryGenerationError(f"AI summary generation failed: {str(e)}")
+            raise SummaryGenerationError(f"AI summary generation failed: {str(e)}") from e
     
-    def _prepare_pr_data_for_ai(self, github_context: GitHubPRContext) -> Dict[str, Any]:
+    def _prepared(self, key: Hashable, build: Callable[[], Dict[str, Any]]) -> Mapping[str, Any]:
+        """Return the cached AI input for key, building it on a miss.
+        
+        Results are read-only views, since every caller shares the same one.
+        """
+        prepared = self._prepared_data_cache.get(key)
+        if prepared is None:
+            prepared = MappingProxyType(build())
+            self._prepared_data_cache.set(key, prepared)
+        return prepared
+    
+    def _prepare_pr_data_for_ai(self, github_context: GitHubPRContext) -> Mapping[str, Any]:
         """Convert GitHubPRContext to format expected by AI service."""
+        return self._prepared(
+            ('github', github_context.content_key),
+            lambda: self._build_pr_data_for_ai(github_context)
+        )
+    
+    def _build_pr_data_for_ai(self, github_context: GitHubPRContext) -> Dict[str, Any]:
+        """Build the AI input dict; see _prepare_pr_data_for_ai."""
         return {
             "number": github_context.pr_number,
             "title": github_context.title,
@@ -431,7 +665,7 @@ class SummaryOrchestrationService:
             "changed_files": github_context.file_changes,  # Use detailed file changes
             "commits": github_context.commit_details,    # Use detailed commit info
             "html_url": github_context.html_url,
-            "created_at": github_context.created_at.isoformat(),
+            "created_at": github_context.created_at_iso,
             "head": {"ref": github_context.head_branch},
             "base": {"ref": github_context.base_branch},
             "labels": github_context.labels,
@@ -439,8 +673,15 @@ class SummaryOrchestrationService:
             "review_comments": github_context.review_comments
         }
     
-    def _prepare_jira_data_for_ai(self, jira_context: JiraTicketContext) -> Dict[str, Any]:
+    def _prepare_jira_data_for_ai(self, jira_context: JiraTicketContext) -> Mapping[str, Any]:
         """Convert JiraTicketContext to format expected by AI service."""
+        return self._prepared(
+            ('jira', jira_context.content_key),
+            lambda: self._build_jira_data_for_ai(jira_context)
+        )
+    
+    def _build_jira_data_for_ai(self, jira_context: JiraTicketContext) -> Dict[str, Any]:
+        """Build the AI input dict; see _prepare_jira_data_for_ai."""
         return {
             "key": jira_context.key,
             "summary": jira_context.summary,
@@ -461,42 +702,41 @@ class SummaryOrchestrationService:
     def _calculate_confidence_score(
         self, 
         context: IntegrationContext, 
-        results: Dict[str, Dict[str, Any]]
+        github_result: Dict[str, Any],
+        jira_result: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate confidence score based on data quality and retrieval success.
         
         Args:
             context: Integration context
-            results: Data retrieval results
+            github_result: GitHub retrieval result
+            jira_result: Jira retrieval result, or None if not retrieved
             
         Returns:
             Confidence score between 0.0 and 1.0
         """
         base_confidence = 0.5
+        total_response_time = 0
         
         # GitHub data quality
-        github_result = results.get('github', {})
         if github_result.get('success', False):
             base_confidence += 0.3
+            total_response_time += github_result.get('response_time_ms', 0)
             
             # Bonus for rich PR data
-            if context.github.description and len(context.github.description) > 100:
+            description = context.github.description
+            if description and len(description) > 100:
                 base_confidence += 0.1
             if context.github.review_comments > 0:
                 base_confidence += 0.1
         
         # Jira data quality
-        jira_result = results.get('jira', {})
-        if jira_result.get('success', False):
+        if jira_result is not None and jira_result.get('success', False):
             base_confidence += 0.2
+            total_response_time += jira_result.get('response_time_ms', 0)
         
         # Response time penalty
-        total_response_time = sum(
-            result.get('response_time_ms', 0) 
-            for result in results.values() 
-            if result.get('success', False)
-        )
         if total_response_time > 5000:  # 5 seconds
             base_confidence -= 0.1
         
@@ -533,63 +773,60 @@ class SummaryOrchestrationService:
         # TODO: Implement cancellation logic
         logger.info(
             "Summary generation cancellation requested",
-            extra={"summary_id": summary_id}
+            summary_id=summary_id
         )
         return True
     
+    def _record_summary(self, elapsed_ns: int, success: bool) -> None:
+        """Add one finished summary generation to the running totals."""
+        self._total_count += 1
+        self._total_time_ns += elapsed_ns
+        self._success_count += success
+    
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for the orchestration service."""
+        count = max(self._total_count, 1)
         return {
-            "total_summaries_generated": len(self.performance_metrics),
-            "average_processing_time_ms": sum(
-                metrics.get("processing_time_ms", 0) 
-                for metrics in self.performance_metrics.values()
-            ) / max(len(self.performance_metrics), 1),
-            "success_rate": sum(
-                1 for metrics in self.performance_metrics.values() 
-                if metrics.get("success", False)
-            ) / max(len(self.performance_metrics), 1)
+            "total_summaries_generated": self._total_count,
+            "average_processing_time_ms": self._total_time_ns / count / 1_000_000,
+            "success_rate": self._success_count / count
         }
     
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on all dependent services.
         
+        The checks run concurrently, each bounded by
+        ``HEALTH_CHECK_TIMEOUT_SECONDS``, so one slow dependency cannot stall
+        the others.
+        
         Returns:
             Health status of all services
         """
-        try:
-            # Check GitHub service
-            github_healthy = await self._check_github_health()
-            
-            # Check Jira service  
-            jira_healthy = await self._check_jira_health()
-            
-            # Check Gemini service
-            gemini_healthy = await self._check_gemini_health()
-            
-            overall_healthy = github_healthy and jira_healthy and gemini_healthy
-            
-            return {
-                "overall": "healthy" if overall_healthy else "unhealthy",
-                "services": {
-                    "github": "healthy" if github_healthy else "unhealthy",
-                    "jira": "healthy" if jira_healthy else "unhealthy",
-                    "gemini": "healthy" if gemini_healthy else "unhealthy"
-                }
+        github_healthy, jira_healthy, gemini_healthy = await asyncio.gather(
+            self._run_health_check(self._check_github_health()),
+            self._run_health_check(self._check_jira_health()),
+            self._run_health_check(self._check_gemini_health())
+        )
+        
+        overall_healthy = github_healthy and jira_healthy and gemini_healthy
+        
+        return {
+            "overall": "healthy" if overall_healthy else "unhealthy",
+            "services": {
+                "github": "healthy" if github_healthy else "unhealthy",
+                "jira": "healthy" if jira_healthy else "unhealthy",
+                "gemini": "healthy" if gemini_healthy else "unhealthy"
             }
-            
+        }
+    
+    async def _run_health_check(self, check: Awaitable[bool]) -> bool:
+        """Await one health check, treating errors and timeouts as unhealthy."""
+        try:
+            return await asyncio.wait_for(check, timeout=self.HEALTH_CHECK_TIMEOUT_SECONDS)
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
-            return {
-                "overall": "unhealthy",
-                "error": str(e),
-                "services": {
-                    "github": "unknown",
-                    "jira": "unknown", 
-                    "gemini": "unknown"
-                }
-            }
+            logger.error(f"Health check failed: {str(e) or type(e).__name__}")
+            return False
     
     async def _check_github_health(self) -> bool:
         """Check GitHub service health."""
@@ -627,6 +864,6 @@ class SummaryOrchestrationService:
             "health": {
                 "service_initialized": True,
                 "dependencies_count": 3,
-                "uptime_seconds": time.time() - getattr(self, '_start_time', time.time())
+                "uptime_seconds": (time.perf_counter_ns() - self._started_ns) / 1e9
             }
         }
\ No newline at end of file
@@ -4,7 +4,9 @@ This module provides FastAPI dependency injection functions for authentication,
 authorization, and user session management.
 """
 
-from typing import Optional, List, Annotated
+import functools
+from contextvars import ContextVar
+from typing import Optional, Sequence, Tuple, Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -17,11 +19,18 @@ from src.utils.logger import get_logger
 security = HTTPBearer(auto_error=False)
 logger = get_logger("auth_dependencies")
 
+# Role claim value -> role; an unknown claim fails the lookup like UserRole() would
+_ROLE_BY_NAME = {role.value: role for role in UserRole}
 
-async def get_token_from_header(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> Optional[str]:
-    """Extract JWT token from Authorization header.
+# Session authenticated for the current request, for code outside dependency injection
+_current_user_ctx: ContextVar[Optional[UserSession]] = ContextVar("current_user", default=None)
+
+
+def _bearer_token(credentials: Optional[HTTPAuthorizationCredentials]) -> Optional[str]:
+    """Extract the JWT from Authorization header credentials.
+    
+    A plain helper rather than a dependency, so FastAPI resolves one fewer
+    dependency per authenticated request.
     
     Args:
         credentials: HTTP authorization credentials
@@ -34,8 +43,13 @@ async def get_token_from_header(
     return None
 
 
-async def get_current_user(token: Optional[str] = Depends(get_token_from_header)) -> UserSession:
-    """Get current authenticated user from JWT token.
+def _validate_token_to_session(token: str) -> UserSession:
+    """Resolve a JWT to its user session.
+    
+    Repeat requests with the same token are served from JWTManager's payload
+    cache, which re-checks expiry on every hit. Records the session as the
+    current request's user. Failures propagate as the underlying errors so
+    callers decide whether they become HTTP responses.
     
     Args:
         token: JWT access token
@@ -43,9 +57,46 @@ async def get_current_user(token: Optional[str] = Depends(get_token_from_header)
     Returns:
         User session information
         
+    Raises:
+        AuthenticationError: If the token is invalid or expired
+    """
+    jwt_manager = get_jwt_manager()
+    payload = jwt_manager.validate_token(token)
+    
+    # Extract user information from token
+    user_session = UserSession(
+        user_id=payload["sub"],
+        username=payload["username"],
+        role=_ROLE_BY_NAME[payload.get("role", "user")],
+        permissions=payload.get("permissions", []),
+        session_id=payload.get("jti", ""),
+    )
+    
+    logger.debug("User authenticated successfully", extra={
+        "user_id": user_session.user_id,
+        "username": user_session.username,
+        "role": user_session.role
+    })
+    
+    _current_user_ctx.set(user_session)
+    return user_session
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> UserSession:
+    """Get current authenticated user from JWT token.
+    
+    Args:
+        credentials: Bearer credentials carrying the JWT access token
+        
+    Returns:
+        User session information
+        
     Raises:
         HTTPException: If token is invalid or user not authenticated
     """
+    token = _bearer_token(credentials)
     if not token:
         logger.warning("No authentication token provided")
         raise HTTPException(
@@ -55,25 +106,7 @@ async def get_current_user(token: Optional[str] = Depends(get_token_from_header)
         )
     
     try:
-        jwt_manager = get_jwt_manager()
-        payload = jwt_manager.validate_token(token)
-        
-        # Extract user information from token
-        user_session = UserSession(
-            user_id=payload["sub"],
-            username=payload["username"],
-            role=UserRole(payload.get("role", "user")),
-            permissions=payload.get("permissions", []),
-            session_id=payload.get("jti", ""),
-        )
-        
-        logger.debug("User authenticated successfully", extra={
-            "user_id": user_session.user_id,
-            "username": user_session.username,
-            "role": user_session.role
-        })
-        
-        return user_session
+        return _validate_token_to_session(token)
         
     except AuthenticationError as e:
         logger.warning("Authentication failed", extra={
@@ -98,8 +131,20 @@ async def get_current_user(token: Optional[str] = Depends(get_token_from_header)
         )
 
 
+def get_current_user_sync() -> Optional[UserSession]:
+    """Get the user already authenticated for the current request.
+    
+    For call sites outside dependency injection (audit logging, helpers called
+    from endpoints) that need the caller's identity without re-parsing the JWT.
+    
+    Returns:
+        User session set by get_current_user in this request, or None
+    """
+    return _current_user_ctx.get()
+
+
 async def get_optional_current_user(
-    token: Optional[str] = Depends(get_token_from_header)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[UserSession]:
     """Get current user if authenticated, otherwise return None.
     
@@ -107,23 +152,29 @@ async def get_optional_current_user(
     and anonymous users.
     
     Args:
-        token: JWT access token
+        credentials: Bearer credentials carrying the JWT access token
         
     Returns:
         User session information or None if not authenticated
     """
+    token = _bearer_token(credentials)
     if not token:
         return None
     
+    # Anonymous fallback: skip building and logging the 401 get_current_user would raise
     try:
-        return await get_current_user(token)
-    except HTTPException:
+        return _validate_token_to_session(token)
+    except Exception:
         return None
 
 
+@functools.cache
 def require_role(required_role: UserRole):
     """Create dependency that requires specific user role or higher.
     
+    Memoized, so every route requiring the same role shares one dependency
+    callable and FastAPI resolves it once per request.
+    
     Args:
         required_role: Minimum required role
         
@@ -146,9 +197,12 @@ def require_role(required_role: UserRole):
     return role_checker
 
 
+@functools.cache
 def require_permission(required_permission: str):
     """Create dependency that requires specific permission.
     
+    Memoized like require_role.
+    
     Args:
         required_permission: Required permission string
         
@@ -171,15 +225,21 @@ def require_permission(required_permission: str):
     return permission_checker
 
 
-def require_any_permission(required_permissions: List[str]):
+def require_any_permission(required_permissions: Sequence[str]):
     """Create dependency that requires any of the specified permissions.
     
     Args:
-        required_permissions: List of acceptable permissions
+        required_permissions: Acceptable permissions
         
     Returns:
         FastAPI dependency function
     """
+    return _require_any_permission(tuple(required_permissions))
+
+
+@functools.cache
+def _require_any_permission(required_permissions: Tuple[str, ...]):
+    """Memoized builder for require_any_permission, keyed by a hashable tuple."""
     async def permission_checker(current_user: UserSession = Depends(get_current_user)) -> UserSession:
         if not current_user.has_any_permission(required_permissions):
             logger.warning("Authorization failed - no matching permissions", extra={
@@ -4,7 +4,7 @@ This module defines a hierarchy of exceptions used throughout the application
 to provide structured error handling with detailed context information.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 class PRSummarizerError(Exception):
@@ -19,6 +19,13 @@ class PRSummarizerError(Exception):
         details: Optional dictionary with additional error context
     """
     
+    # Serialized "type" value, fixed per class when the class is created
+    _type_name: ClassVar[str] = "PRSummarizerError"
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the exception with message and optional details.
         
@@ -37,7 +44,7 @@ class PRSummarizerError(Exception):
             Dictionary representation of the exception with type, message, and details
         """
         return {
-            "type": self.__class__.__name__,
+            "type": self._type_name,
             "message": self.message,
             "details": self.details
         }
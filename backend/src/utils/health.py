@@ -9,7 +9,8 @@ import platform
 import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 import httpx
 import psutil
@@ -18,6 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.config import get_config
 from src.database.session import get_database_session
+from src.services.http_client import get_http_client
 from src.utils.logger import get_logger, log_external_service_call, log_performance_metric
 
 
@@ -37,20 +39,53 @@ class ComponentStatus(str, Enum):
     DEGRADED = "degraded"
 
 
+# Plain-string status values used in reports, so responses serialize without enum handling
+_UP = ComponentStatus.UP.value
+_DOWN = ComponentStatus.DOWN.value
+_DEGRADED = ComponentStatus.DEGRADED.value
+
+
 class HealthCheck:
     """Main health check service."""
     
-    def __init__(self):
+    # How long a comprehensive report is served before the components are re-probed
+    REPORT_CACHE_TTL_SECONDS = 5.0
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize the health check service.
+        
+        Args:
+            http_client: Client used for external probes; defaults to the
+                process-wide pooled client so keep-alive connections are reused
+        """
         self.logger = get_logger("health_check")
         self.config = get_config()
+        self._http_client = http_client
+        self._report_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._report_lock = asyncio.Lock()
+        
+        # Prime psutil's CPU sampler so later non-blocking reads have a baseline
+        psutil.cpu_percent(interval=None)
+        
+        # Platform details are fixed for the process lifetime
+        self._platform = platform.platform()
+        self._python_version = platform.python_version()
+        
+        # The database URL does not change at runtime, so mask it once
+        self._masked_db_url = self._mask_database_url()
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client used for external service probes."""
+        return self._http_client or get_http_client()
     
     async def check_database(self) -> Dict[str, Any]:
-        """Check database connectivity and performance.
+        """Check database connectivity and response time.
         
         Returns:
             Dictionary with database health status and metrics
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             async with get_database_session() as session:
@@ -58,31 +93,25 @@ class HealthCheck:
                 result = await session.execute(text("SELECT 1"))
                 result.fetchone()
                 
-                # Test more complex query for performance
-                perf_result = await session.execute(text("SELECT COUNT(*) FROM information_schema.tables"))
-                table_count = perf_result.scalar()
-                
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 
                 log_performance_metric(
                     operation="database_health_check",
                     duration_ms=duration_ms,
-                    success=True,
-                    metadata={"table_count": table_count}
+                    success=True
                 )
                 
                 return {
-                    "status": ComponentStatus.UP,
+                    "status": _UP,
                     "response_time_ms": round(duration_ms, 2),
                     "details": {
                         "connected": True,
-                        "table_count": table_count,
-                        "database_url": self._mask_database_url()
+                        "database_url": self._masked_db_url
                     }
                 }
                 
         except SQLAlchemyError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = str(e)
             
             log_performance_metric(
@@ -95,23 +124,23 @@ class HealthCheck:
             self.logger.error("Database health check failed", error=error_msg)
             
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "response_time_ms": round(duration_ms, 2),
                 "details": {
                     "connected": False,
                     "error": error_msg,
-                    "database_url": self._mask_database_url()
+                    "database_url": self._masked_db_url
                 }
             }
         
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = f"Unexpected error: {str(e)}"
             
             self.logger.error("Database health check failed", error=error_msg)
             
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "response_time_ms": round(duration_ms, 2),
                 "details": {
                     "connected": False,
@@ -125,26 +154,38 @@ class HealthCheck:
         Returns:
             Dictionary with external service health status
         """
-        services = {}
-        
-        # Check GitHub API
-        github_status = await self._check_github_api()
-        services["github"] = github_status
+        # Probe GitHub and Google AI concurrently; they are independent
+        github_status, google_ai_status = await asyncio.gather(
+            self._check_github_api(),
+            self._check_google_ai_api(),
+            return_exceptions=True
+        )
         
-        # Check Google AI API (if configured)
-        google_ai_status = await self._check_google_ai_api()
-        services["google_ai"] = google_ai_status
+        services = {
+            "github": github_status,
+            "google_ai": google_ai_status
+        }
         
-        # Determine overall external services status
-        all_up = all(service["status"] == ComponentStatus.UP for service in services.values())
-        any_down = any(service["status"] == ComponentStatus.DOWN for service in services.values())
+        # Handle exceptions from concurrent probes and tally statuses in one pass
+        all_up = True
+        all_down = True
+        for name, service_status in services.items():
+            if isinstance(service_status, Exception):
+                service_status = services[name] = {
+                    "status": _DOWN,
+                    "error": str(service_status)
+                }
+            status = service_status["status"]
+            all_up = all_up and status == _UP
+            all_down = all_down and status == _DOWN
         
+        # Determine overall external services status: degraded while any service is reachable
         if all_up:
-            overall_status = ComponentStatus.UP
-        elif any_down:
-            overall_status = ComponentStatus.DEGRADED
+            overall_status = _UP
+        elif all_down:
+            overall_status = _DOWN
         else:
-            overall_status = ComponentStatus.DEGRADED
+            overall_status = _DEGRADED
         
         return {
             "status": overall_status,
@@ -157,48 +198,47 @@ class HealthCheck:
         Returns:
             GitHub API health status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Use GitHub's public API status endpoint
-                response = await client.get(
-                    "https://api.github.com/zen",
-                    timeout=10.0
+            # Use GitHub's public API status endpoint
+            response = await self.http_client.get(
+                "https://api.github.com/zen",
+                timeout=10.0
+            )
+            
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            
+            if response.status_code == 200:
+                log_external_service_call(
+                    service="github",
+                    operation="health_check",
+                    url="https://api.github.com/zen",
+                    status_code=response.status_code,
+                    duration_ms=duration_ms
                 )
                 
-                duration_ms = (time.time() - start_time) * 1000
-                
-                if response.status_code == 200:
-                    log_external_service_call(
-                        service="github",
-                        operation="health_check",
-                        url="https://api.github.com/zen",
-                        status_code=response.status_code,
-                        duration_ms=duration_ms
-                    )
-                    
-                    return {
-                        "status": ComponentStatus.UP,
-                        "response_time_ms": round(duration_ms, 2),
-                        "details": {
-                            "endpoint": "https://api.github.com/zen",
-                            "status_code": response.status_code
-                        }
+                return {
+                    "status": _UP,
+                    "response_time_ms": round(duration_ms, 2),
+                    "details": {
+                        "endpoint": "https://api.github.com/zen",
+                        "status_code": response.status_code
                     }
-                else:
-                    return {
-                        "status": ComponentStatus.DEGRADED,
-                        "response_time_ms": round(duration_ms, 2),
-                        "details": {
-                            "endpoint": "https://api.github.com/zen",
-                            "status_code": response.status_code,
-                            "error": f"Non-200 response: {response.status_code}"
-                        }
+                }
+            else:
+                return {
+                    "status": _DEGRADED,
+                    "response_time_ms": round(duration_ms, 2),
+                    "details": {
+                        "endpoint": "https://api.github.com/zen",
+                        "status_code": response.status_code,
+                        "error": f"Non-200 response: {response.status_code}"
                     }
-                    
+                }
+                
         except httpx.TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = "Request timeout"
             
             log_external_service_call(
@@ -210,7 +250,7 @@ class HealthCheck:
             )
             
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "response_time_ms": round(duration_ms, 2),
                 "details": {
                     "endpoint": "https://api.github.com/zen",
@@ -219,7 +259,7 @@ class HealthCheck:
             }
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = str(e)
             
             log_external_service_call(
@@ -231,7 +271,7 @@ class HealthCheck:
             )
             
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "response_time_ms": round(duration_ms, 2),
                 "details": {
                     "endpoint": "https://api.github.com/zen",
@@ -245,51 +285,50 @@ class HealthCheck:
         Returns:
             Google AI API health status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # For now, we'll do a basic connectivity check
             # In production, this would use the actual Google AI SDK
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://generativelanguage.googleapis.com",
-                    timeout=10.0
+            response = await self.http_client.get(
+                "https://generativelanguage.googleapis.com",
+                timeout=10.0
+            )
+            
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            
+            # Any response (even 404) indicates the service is reachable
+            if response.status_code in [200, 404, 401, 403]:
+                log_external_service_call(
+                    service="google_ai",
+                    operation="health_check",
+                    url="https://generativelanguage.googleapis.com",
+                    status_code=response.status_code,
+                    duration_ms=duration_ms
                 )
                 
-                duration_ms = (time.time() - start_time) * 1000
-                
-                # Any response (even 404) indicates the service is reachable
-                if response.status_code in [200, 404, 401, 403]:
-                    log_external_service_call(
-                        service="google_ai",
-                        operation="health_check",
-                        url="https://generativelanguage.googleapis.com",
-                        status_code=response.status_code,
-                        duration_ms=duration_ms
-                    )
-                    
-                    return {
-                        "status": ComponentStatus.UP,
-                        "response_time_ms": round(duration_ms, 2),
-                        "details": {
-                            "endpoint": "https://generativelanguage.googleapis.com",
-                            "status_code": response.status_code,
-                            "note": "Basic connectivity check"
-                        }
+                return {
+                    "status": _UP,
+                    "response_time_ms": round(duration_ms, 2),
+                    "details": {
+                        "endpoint": "https://generativelanguage.googleapis.com",
+                        "status_code": response.status_code,
+                        "note": "Basic connectivity check"
                     }
-                else:
-                    return {
-                        "status": ComponentStatus.DEGRADED,
-                        "response_time_ms": round(duration_ms, 2),
-                        "details": {
-                            "endpoint": "https://generativelanguage.googleapis.com",
-                            "status_code": response.status_code,
-                            "error": f"Unexpected response: {response.status_code}"
-                        }
+                }
+            else:
+                return {
+                    "status": _DEGRADED,
+                    "response_time_ms": round(duration_ms, 2),
+                    "details": {
+                        "endpoint": "https://generativelanguage.googleapis.com",
+                        "status_code": response.status_code,
+                        "error": f"Unexpected response: {response.status_code}"
                     }
-                    
+                }
+                
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = str(e)
             
             log_external_service_call(
@@ -301,7 +340,7 @@ class HealthCheck:
             )
             
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "response_time_ms": round(duration_ms, 2),
                 "details": {
                     "endpoint": "https://generativelanguage.googleapis.com",
@@ -316,8 +355,8 @@ class HealthCheck:
             Dictionary with system health metrics
         """
         try:
-            # Get CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Get CPU usage since the previous sample without blocking
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             # Get memory usage
             memory = psutil.virtual_memory()
@@ -339,11 +378,11 @@ class HealthCheck:
             }
             
             # Determine status based on resource usage
-            status = ComponentStatus.UP
+            status = _UP
             if cpu_percent > 90 or memory.percent > 90 or disk_usage["percent"] > 90:
-                status = ComponentStatus.DEGRADED
+                status = _DEGRADED
             elif cpu_percent > 95 or memory.percent > 95 or disk_usage["percent"] > 95:
-                status = ComponentStatus.DOWN
+                status = _DOWN
             
             return {
                 "status": status,
@@ -351,53 +390,72 @@ class HealthCheck:
                     "cpu_percent": cpu_percent,
                     "memory": memory_usage,
                     "disk": disk_usage,
-                    "platform": platform.platform(),
-                    "python_version": platform.python_version()
+                    "platform": self._platform,
+                    "python_version": self._python_version
                 }
             }
             
         except Exception as e:
             self.logger.error("System metrics check failed", error=str(e))
             return {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "error": str(e)
             }
     
     async def comprehensive_health_check(self) -> Dict[str, Any]:
         """Perform comprehensive health check of all components.
         
+        Reports are cached for REPORT_CACHE_TTL_SECONDS so frequent pollers
+        do not re-probe the database and external APIs on every request;
+        concurrent callers during a refresh share a single probe run.
+        
         Returns:
             Complete health check report
         """
-        start_time = time.time()
+        cached = self._report_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         
-        # Run all health checks concurrently
-        database_check, external_check, system_check = await asyncio.gather(
+        async with self._report_lock:
+            cached = self._report_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            
+            report = await self._run_comprehensive_health_check()
+            self._report_cache = (time.monotonic() + self.REPORT_CACHE_TTL_SECONDS, report)
+            return report
+    
+    async def _run_comprehensive_health_check(self) -> Dict[str, Any]:
+        """Probe every component and build the health report.
+        
+        Returns:
+            Complete health check report
+        """
+        start_time = time.perf_counter()
+        
+        # Run the I/O-bound health checks concurrently
+        database_check, external_check = await asyncio.gather(
             self.check_database(),
             self.check_external_services(),
-            asyncio.to_thread(self.check_system_metrics),
             return_exceptions=True
         )
         
+        # System metrics are non-blocking reads, cheaper inline than via a thread
+        system_check = self.check_system_metrics()
+        
         # Handle exceptions from concurrent operations
         if isinstance(database_check, Exception):
             database_check = {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "error": str(database_check)
             }
         
         if isinstance(external_check, Exception):
             external_check = {
-                "status": ComponentStatus.DOWN,
+                "status": _DOWN,
                 "error": str(external_check)
             }
         
-        if isinstance(system_check, Exception):
-            system_check = {
-                "status": ComponentStatus.DOWN,
-                "error": str(system_check)
-            }
-        
         # Determine overall health status
         component_statuses = [
             database_check["status"],
@@ -405,19 +463,19 @@ class HealthCheck:
             system_check["status"]
         ]
         
-        if all(status == ComponentStatus.UP for status in component_statuses):
-            overall_status = HealthStatus.HEALTHY
-        elif any(status == ComponentStatus.DOWN for status in component_statuses):
-            overall_status = HealthStatus.UNHEALTHY
+        if all(status == _UP for status in component_statuses):
+            overall_status = HealthStatus.HEALTHY.value
+        elif any(status == _DOWN for status in component_statuses):
+            overall_status = HealthStatus.UNHEALTHY.value
         else:
-            overall_status = HealthStatus.DEGRADED
+            overall_status = HealthStatus.DEGRADED.value
         
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         
         log_performance_metric(
             operation="comprehensive_health_check",
             duration_ms=duration_ms,
-            success=overall_status != HealthStatus.UNHEALTHY,
+            success=overall_status != HealthStatus.UNHEALTHY.value,
             metadata={"overall_status": overall_status}
         )
         
@@ -443,17 +501,16 @@ class HealthCheck:
         """
         try:
             db_url = str(self.config.database.database_url)
-            # Mask password if present
-            if "@" in db_url and "://" in db_url:
-                scheme, rest = db_url.split("://", 1)
-                if "@" in rest:
-                    credentials, host_path = rest.split("@", 1)
-                    if ":" in credentials:
-                        user, _ = credentials.split(":", 1)
-                        return f"{scheme}://{user}:***@{host_path}"
-                    else:
-                        return f"{scheme}://***@{host_path}"
-            return db_url
+            parts = urlsplit(db_url)
+            # Mask password if present; the host part keeps any port or IPv6 brackets
+            _, at, host = parts.netloc.rpartition("@")
+            if not at:
+                return db_url
+            if parts.password is not None:
+                netloc = f"{parts.username}:***@{host}"
+            else:
+                netloc = f"***@{host}"
+            return urlunsplit(parts._replace(netloc=netloc))
         except Exception:
             return "***masked***"
 
@@ -4,6 +4,11 @@ This module provides JWT token generation, validation, and refresh functionality
 for secure user authentication and authorization.
 """
 
+import hashlib
+import logging
+import os
+import time
+
 import jwt
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Union
@@ -14,6 +19,16 @@ from src.utils.logger import get_logger
 from src.utils.exceptions import PRSummarizerError
 
 
+# Verified payloads keyed by token digest, so a token presented repeatedly is
+# only signature-checked once per TTL. Expiry is re-checked on every hit.
+PAYLOAD_CACHE_MAX_ENTRIES = 10000
+PAYLOAD_CACHE_TTL_SECONDS = 30
+# Unverified claims for informational lookups (user info, TTL); never used for auth
+UNVERIFIED_CACHE_TTL_SECONDS = 60
+
+# Claims every token must carry; enforced by PyJWT during decoding
+REQUIRED_CLAIMS = ["sub", "username", "type", "exp", "iat"]
+
 class TokenType(str, Enum):
     """JWT token type enumeration."""
     
@@ -63,6 +78,11 @@ class InvalidTokenError(AuthenticationError):
         )
 
 
+# Claim values for the token types, resolved once instead of per token
+_ACCESS_TYPE = TokenType.ACCESS.value
+_REFRESH_TYPE = TokenType.REFRESH.value
+
+
 class JWTManager:
     """JWT token management utility."""
     
@@ -75,6 +95,32 @@ class JWTManager:
         self.algorithm = self.config.security.algorithm
         self.access_token_expire_minutes = self.config.security.access_token_expire_minutes
         self.refresh_token_expire_days = 7  # Refresh tokens last 7 days
+        self._access_delta = timedelta(minutes=self.access_token_expire_minutes)
+        self._refresh_delta = timedelta(days=self.refresh_token_expire_days)
+        
+        # Encoder/decoder state prepared once instead of on every call
+        self._jwt = jwt.PyJWT()
+        self._algorithms = [self.algorithm]
+        if self.algorithm.startswith("HS"):
+            key = self.secret_key.encode() if isinstance(self.secret_key, str) else self.secret_key
+            self._signing_key = self._verify_key = key
+        else:
+            # Asymmetric algorithms: secret_key holds the PEM private key, parsed once here
+            self._signing_key = jwt.get_algorithm_by_name(self.algorithm).prepare_key(self.secret_key)
+            self._verify_key = self._signing_key.public_key()
+        
+        if self.algorithm == "RS256":
+            self.logger.warning("RS256 verification is slow; EdDSA (Ed25519) is recommended", extra={
+                "algorithm": self.algorithm
+            })
+        
+        # Imported here: the services package imports the auth models, which import this module
+        from src.services.cache import TTLCache
+        self._payload_cache = TTLCache(
+            PAYLOAD_CACHE_MAX_ENTRIES,
+            min(PAYLOAD_CACHE_TTL_SECONDS, self.access_token_expire_minutes * 60)
+        )
+        self._unverified_cache = TTLCache(PAYLOAD_CACHE_MAX_ENTRIES, UNVERIFIED_CACHE_TTL_SECONDS)
     
     def create_access_token(
         self, 
@@ -94,29 +140,27 @@ class JWTManager:
         Returns:
             JWT access token string
         """
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=self.access_token_expire_minutes
-            )
+        role_value = role.value
+        now = datetime.now(timezone.utc)
+        expire = now + (expires_delta or self._access_delta)
         
+        # Integer timestamps, so PyJWT does not convert datetimes itself
         payload = {
             "sub": user_id,
             "username": username,
-            "role": role.value,
-            "type": TokenType.ACCESS.value,
-            "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "role": role_value,
+            "type": _ACCESS_TYPE,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": self._generate_token_id()  # JWT ID for revocation
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = self._jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         
         self.logger.info("Access token created", extra={
             "user_id": user_id,
             "username": username,
-            "role": role.value,
+            "role": role_value,
             "expires_at": expire.isoformat()
         })
         
@@ -132,18 +176,19 @@ class JWTManager:
         Returns:
             JWT refresh token string
         """
-        expire = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
+        now = datetime.now(timezone.utc)
+        expire = now + self._refresh_delta
         
         payload = {
             "sub": user_id,
             "username": username,
-            "type": TokenType.REFRESH.value,
-            "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "type": _REFRESH_TYPE,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": self._generate_token_id()
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = self._jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         
         self.logger.info("Refresh token created", extra={
             "user_id": user_id,
@@ -167,35 +212,49 @@ class JWTManager:
             InvalidTokenError: If token is invalid
             TokenExpiredError: If token has expired
         """
+        expected_type = token_type.value if token_type else None
+        cache_key = hashlib.sha256(token.encode()).digest()
+        
         try:
-            payload = jwt.decode(
-                token, 
-                self.secret_key, 
-                algorithms=[self.algorithm],
-                options={"verify_exp": True}
-            )
+            payload = self._payload_cache.get(cache_key)
+            if payload is None:
+                payload = self._jwt.decode(
+                    token, 
+                    self._verify_key, 
+                    algorithms=self._algorithms,
+                    options={"verify_exp": True, "require": REQUIRED_CLAIMS}
+                )
+                
+                # Only fully verified payloads are cached; failures are re-checked
+                self._payload_cache.set(cache_key, payload)
+            elif payload["exp"] <= time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
             
             # Validate token type if specified
-            if token_type and payload.get("type") != token_type.value:
-                raise InvalidTokenError(f"expected {token_type.value} token")
+            if expected_type and payload.get("type") != expected_type:
+                raise InvalidTokenError(f"expected {expected_type} token")
             
-            # Ensure required fields are present
-            required_fields = ["sub", "username", "type", "exp", "iat"]
-            for field in required_fields:
-                if field not in payload:
-                    raise InvalidTokenError(f"missing field: {field}")
+            # Hot path: skip building the log payload when debug output is filtered
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug("Token validated successfully", extra={
+                    "user_id": payload.get("sub"),
+                    "username": payload.get("username"),
+                    "token_type": payload.get("type")
+                })
             
-            self.logger.debug("Token validated successfully", extra={
-                "user_id": payload.get("sub"),
-                "username": payload.get("username"),
-                "token_type": payload.get("type")
-            })
-            
-            return payload
+            # Copy so callers cannot alter the cached payload
+            return dict(payload)
             
         except jwt.ExpiredSignatureError:
             self.logger.warning("Token expired", extra={"token": token[:20] + "..."})
-            raise TokenExpiredError(token_type.value if token_type else "unknown")
+            raise TokenExpiredError(expected_type or "unknown")
+            
+        except jwt.MissingRequiredClaimError as e:
+            self.logger.warning("Invalid token", extra={
+                "error": str(e),
+                "token": token[:20] + "..."
+            })
+            raise InvalidTokenError(f"missing field: {e.claim}")
             
         except jwt.InvalidTokenError as e:
             self.logger.warning("Invalid token", extra={
@@ -255,10 +314,7 @@ class JWTManager:
         """
         try:
             # Decode without verification for information extraction
-            payload = jwt.decode(
-                token, 
-                options={"verify_signature": False, "verify_exp": False}
-            )
+            payload = self._decode_unverified(token)
             
             return {
                 "user_id": payload.get("sub"),
@@ -275,14 +331,36 @@ class JWTManager:
             })
             return {}
     
+    def _decode_unverified(self, token: str) -> Dict[str, Any]:
+        """Decode token claims without verification, reusing earlier decodes.
+        
+        A payload already verified by validate_token is reused as is, so a
+        token is parsed at most once per request path. The result is shared
+        with the cache and must not be modified.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            Token payload dictionary
+        """
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = self._payload_cache.get(cache_key) or self._unverified_cache.get(cache_key)
+        if payload is None:
+            payload = self._jwt.decode(
+                token, 
+                options={"verify_signature": False, "verify_exp": False}
+            )
+            self._unverified_cache.set(cache_key, payload)
+        return payload
+    
     def _generate_token_id(self) -> str:
         """Generate unique token ID for JWT ID claim.
         
         Returns:
-            Unique token identifier
+            Unique token identifier (128 random bits as hex)
         """
-        import uuid
-        return str(uuid.uuid4())
+        return os.urandom(16).hex()
     
     def get_token_ttl(self, token: str) -> Optional[int]:
         """Get time-to-live for a token in seconds.
@@ -294,18 +372,14 @@ class JWTManager:
             TTL in seconds, or None if token is invalid/expired
         """
         try:
-            payload = jwt.decode(
-                token, 
-                options={"verify_signature": False, "verify_exp": False}
-            )
+            payload = self._decode_unverified(token)
             
             exp = payload.get("exp")
             if exp:
-                expire_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-                now = datetime.now(timezone.utc)
+                remaining = exp - time.time()
                 
-                if expire_time > now:
-                    return int((expire_time - now).total_seconds())
+                if remaining > 0:
+                    return int(remaining)
             
             return None
             
@@ -10,6 +10,7 @@ import time
 from enum import Enum
 from typing import Any, Dict, Optional, Union
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -45,7 +46,7 @@ def add_correlation_id(logger: Any, name: str, event_dict: Dict[str, Any]) -> Di
 
 
 def add_timestamp(logger: Any, name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
-    """Add ISO timestamp to log event.
+    """Add Unix timestamp to log event, as integer nanoseconds.
     
     Args:
         logger: The logger instance
@@ -55,7 +56,7 @@ def add_timestamp(logger: Any, name: str, event_dict: Dict[str, Any]) -> Dict[st
     Returns:
         Modified event dictionary with timestamp
     """
-    event_dict["timestamp"] = time.time()
+    event_dict["timestamp"] = time.time_ns()
     return event_dict
 
 
@@ -74,10 +75,16 @@ def add_logger_name(logger: Any, name: str, event_dict: Dict[str, Any]) -> Dict[
     return event_dict
 
 
+def _orjson_dumps_str(obj: Any, **kwargs: Any) -> str:
+    """Serialize with orjson for renderers that must emit str rather than bytes."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def configure_logging(
     level: LogLevel = LogLevel.INFO,
     json_format: bool = False,
-    enable_correlation_id: bool = True
+    enable_correlation_id: bool = True,
+    debug_stacks: bool = False
 ) -> None:
     """Configure structured logging for the application.
     
@@ -85,6 +92,7 @@ def configure_logging(
         level: Minimum log level to output
         json_format: Whether to output logs in JSON format
         enable_correlation_id: Whether to enable correlation ID support
+        debug_stacks: Whether to render stack traces for events logged with stack_info=True
     """
     # Configure standard library logging
     log_level = getattr(logging, level.value)
@@ -108,13 +116,16 @@ def configure_logging(
     if enable_correlation_id:
         processors.append(add_correlation_id)
     
-    processors.extend([
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-    ])
+    processors.append(structlog.processors.add_log_level)
+    
+    # Stack rendering is a debugging aid; keep it out of the default chain
+    if debug_stacks:
+        processors.append(structlog.processors.StackInfoRenderer())
     
     if json_format:
-        processors.append(structlog.processors.JSONRenderer())
+        # orjson renders to bytes; decode so structlog and the stdlib handlers
+        # write through the same sys.stdout and their lines stay in order
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps_str))
     else:
         processors.extend([
             structlog.dev.ConsoleRenderer(colors=True),
@@ -149,6 +160,13 @@ def get_logger(name: str = "pr_summarizer", **context: Any) -> structlog.BoundLo
     return logger
 
 
+# Loggers for the log_* helpers, created once rather than per call
+_API_REQUEST_LOGGER = get_logger("api.request")
+_API_RESPONSE_LOGGER = get_logger("api.response")
+_PERFORMANCE_LOGGER = get_logger("performance")
+_EXTERNAL_SERVICE_LOGGERS: Dict[str, structlog.BoundLogger] = {}
+
+
 def log_api_request(
     method: str,
     path: str,
@@ -169,7 +187,9 @@ def log_api_request(
         query_params: Query parameters
         **additional_context: Additional context to log
     """
-    logger = get_logger("api.request")
+    logger = _API_REQUEST_LOGGER
+    if not logger.is_enabled_for(logging.INFO):
+        return
     
     log_data = {
         "method": method,
@@ -216,7 +236,11 @@ def log_api_response(
         error: Error message if request failed
         **additional_context: Additional context to log
     """
-    logger = get_logger("api.response")
+    logger = _API_RESPONSE_LOGGER
+    # Failures log at error level, everything else at info
+    is_failure = status_code >= 400
+    if not logger.is_enabled_for(logging.ERROR if is_failure else logging.INFO):
+        return
     
     log_data = {
         "status_code": status_code,
@@ -239,7 +263,7 @@ def log_api_response(
         log_data["error"] = error
     
     # Log as error if status code indicates failure
-    if status_code >= 400:
+    if is_failure:
         logger.error("API response sent", **log_data)
     else:
         logger.info("API response sent", **log_data)
@@ -269,7 +293,9 @@ def log_external_service_call(
         error: Error message if call failed
         **additional_context: Additional context to log
     """
-    logger = get_logger(f"external.{service}")
+    logger = _EXTERNAL_SERVICE_LOGGERS.get(service)
+    if logger is None:
+        logger = _EXTERNAL_SERVICE_LOGGERS[service] = get_logger(f"external.{service}")
     
     log_data = {
         "service": service,
@@ -322,7 +348,7 @@ def log_performance_metric(
         metadata: Additional operation metadata
         **additional_context: Additional context to log
     """
-    logger = get_logger("performance")
+    logger = _PERFORMANCE_LOGGER
     
     log_data = {
         "operation": operation,
@@ -6,10 +6,15 @@ endpoints, ensuring proper request/response formats and HTTP status codes.
 """
 
 import pytest
+from datetime import datetime
 from typing import Dict, Any
+from unittest.mock import AsyncMock, Mock
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.api.routers.summary import BULK_MAX_CONCURRENCY, get_summary_service, router as summary_router
+from src.models.pr_summary import PRSummary, ProcessingStatus
 
 
 @pytest.fixture
@@ -169,4 +174,92 @@ class TestSummaryAPIContract:
         
         # CORS headers should be present
         headers = response.headers
-        assert "Access-Control-Allow-Origin" in headers or response.status_code == 404
\ No newline at end of file
+        assert "Access-Control-Allow-Origin" in headers or response.status_code == 404
+
+
+class TestSummaryRouterContract:
+    """Contract tests for the summary router's generate endpoints."""
+    
+    @pytest.fixture
+    def summary_service(self):
+        """Summary service double; tests set the batch outcomes."""
+        service = Mock()
+        service.generate_summaries_batch = AsyncMock()
+        return service
+    
+    @pytest.fixture
+    def router_client(self, summary_service):
+        """Client for an app serving only the summary router."""
+        router_app = FastAPI()
+        router_app.include_router(summary_router)
+        router_app.dependency_overrides[get_summary_service] = lambda: summary_service
+        return TestClient(router_app)
+    
+    @staticmethod
+    def make_summary(github_pr_url: str) -> PRSummary:
+        """Build a completed summary for a PR URL."""
+        return PRSummary(
+            id="summary-1",
+            github_pr_url=github_pr_url,
+            business_context="Business context",
+            code_change_summary="Code change summary",
+            business_code_impact="Business code impact",
+            suggested_test_cases=["Test the change"],
+            risk_complexity="Low complexity",
+            reviewer_guidance="Review the change",
+            status=ProcessingStatus.COMPLETED,
+            created_at=datetime.now()
+        )
+    
+    def test_bulk_reports_results_per_pr_in_order(self, router_client, summary_service):
+        """Test that each PR gets its own result, failures included, in request order."""
+        urls = [
+            "https://github.com/owner/repo/pull/1",
+            "https://github.com/owner/repo/pull/2",
+        ]
+        summary_service.generate_summaries_batch.return_value = [
+            self.make_summary(urls[0]),
+            RuntimeError("GitHub unavailable"),
+        ]
+        
+        response = router_client.post(
+            "/api/v1/summary/generate-bulk",
+            json={"pr_requests": [{"github_pr_url": url} for url in urls]}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert data["succeeded"] == 1
+        assert [r["github_pr_url"] for r in data["results"]] == urls
+        assert data["results"][0]["status"] == "completed"
+        assert data["results"][1]["status"] == "failed"
+        assert data["results"][1]["error"] == "GitHub unavailable"
+    
+    @pytest.mark.parametrize("parallel, expected", [(True, BULK_MAX_CONCURRENCY), (False, 1)])
+    def test_bulk_concurrency_follows_parallel_flag(
+        self, router_client, summary_service, parallel, expected
+    ):
+        """Test that parallel_processing=false processes PRs one at a time."""
+        url = "https://github.com/owner/repo/pull/1"
+        summary_service.generate_summaries_batch.return_value = [self.make_summary(url)]
+        
+        router_client.post(
+            "/api/v1/summary/generate-bulk",
+            json={"pr_requests": [{"github_pr_url": url}], "parallel_processing": parallel}
+        )
+        
+        kwargs = summary_service.generate_summaries_batch.await_args.kwargs
+        assert kwargs["max_concurrency"] == expected
+    
+    @pytest.mark.parametrize("query, expected", [("", None), ("?regenerate=true", {"cache": False})])
+    def test_generate_regenerate_skips_ai_cache(self, router_client, summary_service, query, expected):
+        """Test that regenerate=true asks the service to bypass cached AI output."""
+        url = "https://github.com/owner/repo/pull/1"
+        summary_service.generate_summary = AsyncMock(return_value=self.make_summary(url))
+        
+        response = router_client.post(f"/api/v1/summary/generate{query}", json={"github_pr_url": url})
+        
+        assert response.status_code == 200
+        assert summary_service.generate_summary.await_args.args[1] == expected
+
@@ -0,0 +1,65 @@
+"""
+Unit tests for the authentication service.
+
+This module tests the default admin account and local password login.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.models.auth import LoginRequest
+from src.services.auth import AuthService, InvalidCredentialsError
+
+
+class TestDefaultAdmin:
+    """Tests for the development admin account."""
+
+    @pytest.fixture
+    def auth_service(self):
+        """Create an AuthService instance for testing."""
+        return AuthService()
+
+    def test_init_does_not_hash_password(self):
+        """Test that building the service runs no bcrypt hash."""
+        with patch.object(AuthService, "_hash_password") as hash_password:
+            AuthService()
+
+        hash_password.assert_not_called()
+
+    async def test_admin_password_hashed_on_first_login(self, auth_service):
+        """Test that the admin password is hashed once, off the event loop."""
+        with patch.object(
+            auth_service, "_hash_password_async", wraps=auth_service._hash_password_async
+        ) as hash_async:
+            await auth_service.authenticate_user(LoginRequest(username="admin", password="admin123"))
+            await auth_service.authenticate_user(LoginRequest(username="admin", password="admin123"))
+
+        hash_async.assert_called_once_with("admin123")
+        assert auth_service._passwords["admin-001"].startswith("$2")
+        assert "admin-001" not in auth_service._pending_passwords
+
+    async def test_wrong_admin_password_rejected(self, auth_service):
+        """Test that the lazily hashed admin password still rejects bad logins."""
+        with pytest.raises(InvalidCredentialsError):
+            await auth_service.authenticate_user(LoginRequest(username="admin", password="wrong"))
+
+
+class TestUserResponses:
+    """Tests for the cached user response models."""
+
+    @pytest.fixture
+    def auth_service(self):
+        """Create an AuthService instance for testing."""
+        return AuthService()
+
+    async def test_changing_returned_user_leaves_cache_intact(self, auth_service):
+        """Test that callers cannot alter the response served to later reads."""
+        first = await auth_service.get_user_by_id("admin-001")
+        first.permissions.append("admin:everything")
+        first.full_name = "Changed"
+
+        second = await auth_service.get_user_by_id("admin-001")
+
+        assert second is not first
+        assert "admin:everything" not in second.permissions
+        assert second.full_name == "Administrator"
@@ -0,0 +1,168 @@
+"""
+Unit tests for the in-process caching helpers.
+
+This module tests TTLCache expiry and LRU eviction, and the per-instance
+behaviour of the memoized_fetch decorator.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.cache import TTLCache, memoized_fetch
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the cache module's clock with a controllable one."""
+    fake = FakeClock()
+    with patch("src.services.cache.time.monotonic", fake):
+        yield fake
+
+
+class TestTTLCache:
+    """Unit tests for TTLCache."""
+
+    def test_get_returns_stored_value(self, clock):
+        """Test that a fresh entry is returned."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_get_missing_key_returns_none(self, clock):
+        """Test that an unknown key is a miss."""
+        assert TTLCache(maxsize=4, ttl=10).get("missing") is None
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test that entries stop being served once their TTL has passed."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+
+        clock.now += 9.9
+        assert cache.get("a") == 1
+
+        clock.now += 0.1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_set_refreshes_expiry(self, clock):
+        """Test that overwriting an entry restarts its TTL."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        clock.now += 8
+        cache.set("a", 2)
+        clock.now += 8
+        assert cache.get("a") == 2
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test that a full cache evicts the least recently used entry."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Reading "a" makes "b" the least recently used
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_clear_drops_all_entries(self, clock):
+        """Test that clear empties the cache."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+
+class Fetcher:
+    """Service double whose fetch method is memoized."""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self.calls = []
+
+    @memoized_fetch(ttl=10, maxsize=2, on_hit=lambda value: f"cached:{value}")
+    async def fetch(self, item: str) -> str:
+        self.calls.append(item)
+        if item == "boom":
+            raise ValueError("fetch failed")
+        return f"{self.prefix}{item}"
+
+    @memoized_fetch(ttl=10, key=lambda item, **_: item.lower())
+    async def fetch_keyed(self, item: str, verbose: bool = False) -> str:
+        self.calls.append(item)
+        return item
+
+
+class TestMemoizedFetch:
+    """Unit tests for the memoized_fetch decorator."""
+
+    async def test_repeat_call_is_served_from_cache(self, clock):
+        """Test that a second call within the TTL skips the fetch."""
+        fetcher = Fetcher()
+        assert await fetcher.fetch("x") == "x"
+        assert await fetcher.fetch("x") == "cached:x"
+        assert fetcher.calls == ["x"]
+
+    async def test_on_hit_not_applied_to_fresh_results(self, clock):
+        """Test that on_hit only transforms results served from cache."""
+        fetcher = Fetcher()
+        assert await fetcher.fetch("x") == "x"
+        assert await fetcher.fetch("y") == "y"
+
+    async def test_expired_result_is_refetched(self, clock):
+        """Test that a result past its TTL triggers a new fetch."""
+        fetcher = Fetcher()
+        await fetcher.fetch("x")
+        clock.now += 10
+        assert await fetcher.fetch("x") == "x"
+        assert fetcher.calls == ["x", "x"]
+
+    async def test_results_evicted_beyond_maxsize(self, clock):
+        """Test that each instance's cache is bounded by maxsize."""
+        fetcher = Fetcher()
+        await fetcher.fetch("a")
+        await fetcher.fetch("b")
+        await fetcher.fetch("c")
+
+        await fetcher.fetch("a")
+        assert fetcher.calls == ["a", "b", "c", "a"]
+
+    async def test_instances_do_not_share_entries(self, clock):
+        """Test that each instance keeps its own cache."""
+        first = Fetcher(prefix="first-")
+        second = Fetcher(prefix="second-")
+
+        assert await first.fetch("x") == "first-x"
+        assert await second.fetch("x") == "second-x"
+        assert first.calls == ["x"]
+        assert second.calls == ["x"]
+
+    async def test_exceptions_are_not_cached(self, clock):
+        """Test that a failed fetch is retried on the next call."""
+        fetcher = Fetcher()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await fetcher.fetch("boom")
+        assert fetcher.calls == ["boom", "boom"]
+
+    async def test_custom_key(self, clock):
+        """Test that calls mapping to the same key share one entry."""
+        fetcher = Fetcher()
+        await fetcher.fetch_keyed("ABC")
+        assert await fetcher.fetch_keyed("abc", verbose=True) == "ABC"
+        assert fetcher.calls == ["ABC"]
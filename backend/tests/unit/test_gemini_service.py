@@ -5,12 +5,14 @@ This module tests the Gemini AI service functionality including
 summary generation, prompt handling, and error management.
 """
 
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any
 from datetime import datetime
 
-from src.services.gemini import GeminiService
+from src.services.gemini import GeminiService, _extract_json_block
 from src.models.pr_summary import PRSummary, ProcessingStatus
 
 
@@ -364,4 +366,180 @@ class TestGeminiService:
         invalid_pr_data = {"invalid": "data"}
         
         with pytest.raises(Exception):
-            await gemini_service.generate_summary(pr_data=invalid_pr_data)
\ No newline at end of file
+            await gemini_service.generate_summary(pr_data=invalid_pr_data)
+
+class TestGeminiBatchGeneration:
+    """Unit tests for GeminiService.generate_summaries_batch."""
+    
+    @pytest.fixture
+    def gemini_service(self):
+        """Create a GeminiService with a placeholder API key."""
+        return GeminiService(api_key="test-key")
+    
+    @staticmethod
+    def make_summary(title: str) -> PRSummary:
+        """Build a completed summary named after a PR title."""
+        return PRSummary(
+            id=f"summary-{title}",
+            github_pr_url="https://github.com/owner/repo/pull/1",
+            business_context=title,
+            code_change_summary="Code change summary",
+            business_code_impact="Business code impact",
+            suggested_test_cases=["Test the change"],
+            risk_complexity="Low complexity",
+            reviewer_guidance="Review the change",
+            status=ProcessingStatus.COMPLETED,
+            created_at=datetime.now()
+        )
+    
+    async def test_batch_preserves_order_and_isolates_failures(self, gemini_service):
+        """Test that results follow input order and a failure stays in its slot."""
+        async def generate(pr_data, **kwargs):
+            if pr_data["title"] == "bad":
+                raise ValueError("generation failed")
+            return self.make_summary(pr_data["title"])
+        
+        items = [{"pr_data": {"title": title}} for title in ("a", "bad", "c")]
+        with patch.object(gemini_service, "generate_summary", AsyncMock(side_effect=generate)):
+            results = await gemini_service.generate_summaries_batch(items)
+        
+        assert results[0].business_context == "a"
+        assert isinstance(results[1], ValueError)
+        assert results[2].business_context == "c"
+    
+    async def test_batch_respects_max_concurrency(self, gemini_service):
+        """Test that no more than max_concurrency generations run at once."""
+        running = 0
+        peak = 0
+        
+        async def generate(pr_data, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return self.make_summary(pr_data["title"])
+        
+        items = [{"pr_data": {"title": str(n)}} for n in range(6)]
+        with patch.object(gemini_service, "generate_summary", AsyncMock(side_effect=generate)):
+            await gemini_service.generate_summaries_batch(items, max_concurrency=2)
+        
+        assert peak == 2
+
+
+class TestJsonBlockExtraction:
+    """Unit tests for locating the JSON object in an AI response."""
+    
+    @pytest.fixture
+    def gemini_service(self):
+        """Create a GeminiService with a placeholder API key."""
+        return GeminiService(api_key="test-key")
+    
+    def test_unmatched_brace_before_json(self):
+        """Test that a brace never closed in leading prose is skipped."""
+        assert _extract_json_block('Note: a { brace. {"a": 1}') == (17, 25)
+    
+    def test_braces_inside_strings_are_ignored(self):
+        """Test that braces in string values, and escaped quotes, don't end the block."""
+        text = 'Result: {"code": "if (x) { y(\\"}\\") }", "n": 1} trailing }'
+        begin, end = _extract_json_block(text)
+        assert text[begin:end] == '{"code": "if (x) { y(\\"}\\") }", "n": 1}'
+    
+    def test_no_block_returns_none(self):
+        """Test that text without a balanced block yields None."""
+        assert _extract_json_block("no json { here") is None
+    
+    def test_start_offset(self):
+        """Test that blocks before start are not returned."""
+        assert _extract_json_block('{"a": 1} {"b": 2}', 1) == (9, 17)
+    
+    def test_enclosing_block_replaces_nested_candidate(self):
+        """Test that a closed block wins over the blocks nested in it, despite an earlier open brace."""
+        text = 'a { b {"x": {"y": 1}} c'
+        assert _extract_json_block(text) == (6, 21)
+    
+    def test_unclosed_braces_scanned_once(self):
+        """Test that a long run of unclosed braces is handled in a single pass."""
+        text = "{" * 200_000 + '{"a": 1}'
+        t0 = time.perf_counter()
+        assert _extract_json_block(text) == (200_000, 200_008)
+        assert time.perf_counter() - t0 < 1.0
+    
+    def test_parse_skips_unmatched_brace(self, gemini_service):
+        """Test that parsing finds the JSON after an unclosed brace instead of falling back."""
+        result = gemini_service._parse_ai_response(
+            'Note: a { brace. {"business_context": "Auth feature"}'
+        )
+        assert result == {"business_context": "Auth feature"}
+    
+    def test_parse_skips_balanced_non_json_block(self, gemini_service):
+        """Test that a balanced {x} that isn't JSON is passed over."""
+        result = gemini_service._parse_ai_response(
+            'Use {x} as a placeholder.\n{"business_context": "Auth feature"}'
+        )
+        assert result == {"business_context": "Auth feature"}
+    
+    def test_parse_falls_back_without_json(self, gemini_service):
+        """Test that the fallback summary is used when no JSON object exists."""
+        result = gemini_service._parse_ai_response("Plain prose with {x} only")
+        assert result["business_context"].startswith("AI Analysis: Plain prose")
+
+
+class TestPromptCache:
+    """Unit tests for reuse of AI responses per prompt."""
+    
+    PR_DATA = {"title": "Add user authentication", "html_url": "https://github.com/owner/repo/pull/123"}
+    
+    @pytest.fixture
+    def gemini_service(self):
+        """Create a GeminiService whose model returns a new summary per call."""
+        service = GeminiService(api_key="test-key")
+        responses = iter(range(1, 100))
+        service.model = Mock()
+        service.model.generate_content_async = AsyncMock(
+            side_effect=lambda prompt: Mock(text=f'{{"business_context": "run {next(responses)}"}}')
+        )
+        return service
+    
+    async def test_repeat_prompt_served_from_cache(self, gemini_service):
+        """Test that an identical prompt reuses the earlier response."""
+        first = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        second = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        
+        assert gemini_service.model.generate_content_async.await_count == 1
+        assert second.business_context == first.business_context == "run 1"
+    
+    async def test_cache_false_generates_fresh_summary(self, gemini_service):
+        """Test that options["cache"] = False calls the model and refreshes the cache."""
+        await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        fresh = await gemini_service.generate_summary(pr_data=self.PR_DATA, options={"cache": False})
+        after = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        
+        assert gemini_service.model.generate_content_async.await_count == 2
+        assert fresh.business_context == "run 2"
+        assert after.business_context == "run 2"
+    
+    async def test_cached_response_expires(self, gemini_service):
+        """Test that responses are regenerated once the cache TTL has passed."""
+        await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        
+        later = time.monotonic() + GeminiService.PROMPT_CACHE_TTL_SECONDS
+        with patch("src.services.cache.time.monotonic", return_value=later):
+            result = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        
+        assert result.business_context == "run 2"
+
+    
+    async def test_fallback_summary_not_cached(self, gemini_service):
+        """Test that a reply without JSON is not served to later identical requests."""
+        gemini_service.model.generate_content_async = AsyncMock(side_effect=[
+            Mock(text="Sorry, I cannot help with that."),
+            Mock(text='{"business_context": "parsed"}'),
+        ])
+        
+        fallback = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        retry = await gemini_service.generate_summary(pr_data=self.PR_DATA)
+        
+        assert fallback.business_context.startswith("AI Analysis: Sorry")
+        assert retry.business_context == "parsed"
+        assert gemini_service.model.generate_content_async.await_count == 2
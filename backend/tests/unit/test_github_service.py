@@ -5,6 +5,7 @@ This module tests the GitHub service functionality including
 PR data retrieval, URL validation, and error handling.
 """
 
+import time
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any
@@ -277,4 +278,109 @@ class TestGitHubService:
             assert re.match(pattern, url), f"Valid URL {url} should match pattern"
             
         for url in invalid_urls:
-            assert not re.match(pattern, url), f"Invalid URL {url} should not match pattern"
\ No newline at end of file
+            assert not re.match(pattern, url), f"Invalid URL {url} should not match pattern"
+
+class TestPRDetailsCache:
+    """Unit tests for the per-PR details cache."""
+    
+    URL = "https://github.com/owner/repo/pull/123"
+    
+    @pytest.fixture
+    def github_service(self):
+        """Create a GitHubService whose API fetch is stubbed."""
+        service = GitHubService(token="test-token", http_client=Mock())
+        service._fetch_pr_details = AsyncMock(return_value={"number": 123, "url": self.URL})
+        return service
+    
+    async def test_cached_details_empty_before_fetch(self, github_service):
+        """Test that nothing is cached before the first fetch."""
+        assert github_service.cached_pr_details(self.URL) is None
+    
+    async def test_repeat_fetch_served_from_cache(self, github_service):
+        """Test that a second request for the PR skips the API."""
+        await github_service.get_pr_details(self.URL)
+        result = await github_service.get_pr_details(self.URL + "/")
+        
+        github_service._fetch_pr_details.assert_awaited_once()
+        assert result == {"number": 123, "url": self.URL + "/"}
+        assert github_service.cached_pr_details(self.URL)["number"] == 123
+    
+    async def test_cached_details_expire(self, github_service):
+        """Test that details are refetched once the cache TTL has passed."""
+        await github_service.get_pr_details(self.URL)
+        
+        later = time.monotonic() + GitHubService.PR_CACHE_TTL_SECONDS
+        with patch("src.services.cache.time.monotonic", return_value=later):
+            assert github_service.cached_pr_details(self.URL) is None
+            await github_service.get_pr_details(self.URL)
+        
+        assert github_service._fetch_pr_details.await_count == 2
+
+
+class TestFetchPRDetails:
+    """Unit tests for assembling PR details from API responses."""
+    
+    URL = "https://github.com/owner/repo/pull/123"
+    
+    @staticmethod
+    def pull_request(commit_author) -> Dict[str, Any]:
+        """GraphQL pullRequest payload with one commit by commit_author."""
+        return {
+            "repository": {
+                "pullRequest": {
+                    "number": 123, "title": "Add auth", "body": None, "state": "OPEN",
+                    "isDraft": False, "mergeable": "MERGEABLE", "merged": False,
+                    "url": "https://github.com/owner/repo/pull/123",
+                    "createdAt": "2025-01-15T10:00:00Z", "updatedAt": "2025-01-15T15:30:00Z",
+                    "author": None,
+                    "headRefName": "feature/auth", "baseRefName": "main",
+                    "headRefOid": "abc123", "baseRefOid": "def456",
+                    "additions": 10, "deletions": 2, "changedFiles": 1,
+                    "labels": {"nodes": []},
+                    "comments": {"totalCount": 0},
+                    "reviewThreads": {"nodes": [
+                        {"comments": {"totalCount": 3}}, {"comments": {"totalCount": 1}}
+                    ]},
+                    "commits": {"nodes": [
+                        {"commit": {"oid": "abc123", "message": "Add auth", "author": commit_author}}
+                    ]}
+                }
+            }
+        }
+    
+    @pytest.fixture
+    def github_service(self):
+        """Create a GitHubService with no network access."""
+        service = GitHubService(token="test-token", http_client=Mock())
+        service._get_json = AsyncMock(return_value=[])
+        return service
+    
+    async def test_null_authors_reported_as_ghost(self, github_service):
+        """Test that a null PR or commit author doesn't fail the fetch."""
+        github_service._graphql = AsyncMock(return_value=self.pull_request(None))
+        
+        details = await github_service._fetch_pr_details(self.URL, "owner", "repo", "123")
+        
+        assert details["author"] == "ghost"
+        assert details["commits"] == [
+            {"sha": "abc123", "message": "Add auth", "author": "ghost", "date": None}
+        ]
+    
+    async def test_commit_author_mapped(self, github_service):
+        """Test that commit author name and date are taken from the GraphQL node."""
+        github_service._graphql = AsyncMock(return_value=self.pull_request(
+            {"name": "Dev", "date": "2025-01-15T10:00:00Z"}
+        ))
+        
+        details = await github_service._fetch_pr_details(self.URL, "owner", "repo", "123")
+        
+        assert details["commits"][0]["author"] == "Dev"
+        assert details["commits"][0]["date"] == "2025-01-15T10:00:00Z"
+    
+    async def test_review_comments_count_comments_not_threads(self, github_service):
+        """Test that review_comments sums the comments across review threads."""
+        github_service._graphql = AsyncMock(return_value=self.pull_request(None))
+        
+        details = await github_service._fetch_pr_details(self.URL, "owner", "repo", "123")
+        
+        assert details["review_comments"] == 4
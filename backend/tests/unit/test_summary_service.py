@@ -0,0 +1,144 @@
+"""
+Unit tests for the summary orchestration service.
+
+This module tests batch summary generation: result ordering, per-item
+failures, the concurrency limit and the shared Jira prefetch.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from datetime import datetime
+
+from src.models.pr_summary import PRSummary, ProcessingStatus
+from src.models.request import SummaryRequest
+from src.services.summary_service import (
+    SummaryOrchestrationError,
+    SummaryOrchestrationService,
+)
+
+
+def make_summary(github_pr_url: str) -> PRSummary:
+    """Build a completed summary for a PR URL."""
+    return PRSummary(
+        id=f"summary-{github_pr_url.rsplit('/', 1)[-1]}",
+        github_pr_url=github_pr_url,
+        business_context="Business context",
+        code_change_summary="Code change summary",
+        business_code_impact="Business code impact",
+        suggested_test_cases=["Test the change"],
+        risk_complexity="Low complexity",
+        reviewer_guidance="Review the change",
+        status=ProcessingStatus.COMPLETED,
+        created_at=datetime.now()
+    )
+
+
+def make_request(number: int, jira_ticket_id: str = None) -> SummaryRequest:
+    """Build a summary request for PR ``number``."""
+    return SummaryRequest(
+        github_pr_url=f"https://github.com/owner/repo/pull/{number}",
+        jira_ticket_id=jira_ticket_id
+    )
+
+
+class TestGenerateSummariesBatch:
+    """Unit tests for SummaryOrchestrationService.generate_summaries_batch."""
+
+    @pytest.fixture
+    def jira_service(self):
+        """Jira service double whose bulk lookup finds nothing."""
+        service = Mock()
+        service.get_tickets_bulk = AsyncMock(return_value={})
+        return service
+
+    @pytest.fixture
+    def summary_service(self, jira_service):
+        """Orchestrator whose context building and AI step are stubbed."""
+        service = SummaryOrchestrationService(
+            github_service=Mock(),
+            jira_service=jira_service,
+            gemini_service=Mock()
+        )
+        service._build_integration_context = AsyncMock(return_value=Mock())
+        return service
+
+    def ai_summaries(self, service, side_effect):
+        """Stub the AI step, generating summaries from the enhanced options."""
+        return patch.object(service, "_generate_ai_summary", AsyncMock(side_effect=side_effect))
+
+    async def test_results_in_request_order(self, summary_service):
+        """Test that results line up with requests even when they finish out of order."""
+        async def generate(context, options):
+            # Earlier PRs finish last
+            await asyncio.sleep(0.01 * (5 - int(options["github_pr_url"].rsplit("/", 1)[-1])))
+            return make_summary(options["github_pr_url"])
+
+        requests = [make_request(n) for n in range(1, 5)]
+        with self.ai_summaries(summary_service, generate):
+            results = await summary_service.generate_summaries_batch(requests)
+
+        assert [r.github_pr_url for r in results] == [r.github_pr_url for r in requests]
+
+    async def test_failed_item_does_not_abort_batch(self, summary_service):
+        """Test that one failure is returned in place while the rest succeed."""
+        async def generate(context, options):
+            if options["github_pr_url"].endswith("/2"):
+                raise RuntimeError("model unavailable")
+            return make_summary(options["github_pr_url"])
+
+        requests = [make_request(n) for n in range(1, 4)]
+        with self.ai_summaries(summary_service, generate):
+            results = await summary_service.generate_summaries_batch(requests)
+
+        assert isinstance(results[0], PRSummary)
+        assert isinstance(results[1], SummaryOrchestrationError)
+        assert isinstance(results[2], PRSummary)
+
+    async def test_items_go_through_single_summary_pipeline(self, summary_service):
+        """Test that batch items get timings and count towards service metrics."""
+        async def generate(context, options):
+            return make_summary(options["github_pr_url"])
+
+        with self.ai_summaries(summary_service, generate):
+            results = await summary_service.generate_summaries_batch(
+                [make_request(1), make_request(2)]
+            )
+
+        assert all(r.processing_time_ms is not None for r in results)
+        assert summary_service.get_performance_metrics()["total_summaries_generated"] == 2
+
+    async def test_respects_max_concurrency(self, summary_service):
+        """Test that no more than max_concurrency summaries run at once."""
+        running = 0
+        peak = 0
+
+        async def generate(context, options):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return make_summary(options["github_pr_url"])
+
+        requests = [make_request(n) for n in range(1, 9)]
+        with self.ai_summaries(summary_service, generate):
+            results = await summary_service.generate_summaries_batch(requests, max_concurrency=3)
+
+        assert len(results) == 8
+        assert peak == 3
+
+    async def test_jira_tickets_prefetched_in_one_lookup(self, summary_service, jira_service):
+        """Test that referenced tickets are fetched in bulk and offered to every item."""
+        async def generate(context, options):
+            return make_summary(options["github_pr_url"])
+
+        requests = [make_request(1, "PROJ-1"), make_request(2), make_request(3, "PROJ-3")]
+        with self.ai_summaries(summary_service, generate):
+            await summary_service.generate_summaries_batch(requests)
+
+        jira_service.get_tickets_bulk.assert_awaited_once_with(["PROJ-1", "PROJ-3"])
+        prefetches = {
+            call.args[2] for call in summary_service._build_integration_context.await_args_list
+        }
+        assert len(prefetches) == 1 and None not in prefetches
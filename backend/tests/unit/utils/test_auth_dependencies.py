@@ -0,0 +1,79 @@
+"""Tests for FastAPI authentication dependencies."""
+
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.models.config import SecurityConfig
+from src.utils.auth_dependencies import (
+    get_current_user,
+    get_current_user_sync,
+    get_optional_current_user,
+)
+from src.utils.jwt import JWTManager
+
+
+@pytest.fixture
+def jwt_manager() -> JWTManager:
+    """Create an HS256 JWTManager and make the dependencies use it."""
+    config = MagicMock()
+    config.security = SecurityConfig(secret_key="test-secret-key")
+    with patch("src.utils.jwt.get_config", return_value=config):
+        manager = JWTManager()
+    with patch("src.utils.auth_dependencies.get_jwt_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture
+def client(jwt_manager) -> TestClient:
+    """Client for an app whose endpoints report get_current_user_sync()."""
+    app = FastAPI()
+
+    def username() -> Optional[str]:
+        user = get_current_user_sync()
+        return user.username if user is not None else None
+
+    @app.get("/required")
+    async def required(current_user=Depends(get_current_user)):
+        return {"dependency": current_user.username, "context": username()}
+
+    @app.get("/optional")
+    async def optional(current_user=Depends(get_optional_current_user)):
+        return {"context": username()}
+
+    return TestClient(app)
+
+
+class TestCurrentUserContext:
+    """Test the request-scoped user set by the authentication dependencies."""
+
+    def test_authenticated_user_visible_in_endpoint(self, client, jwt_manager):
+        """Test that get_current_user_sync returns the user resolved by get_current_user."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+
+        response = client.get("/required", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert response.json() == {"dependency": "alice", "context": "alice"}
+
+    def test_anonymous_request_has_no_user(self, client, jwt_manager):
+        """Test that the context is empty for anonymous requests, even after an authenticated one."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+        client.get("/required", headers={"Authorization": f"Bearer {token}"})
+
+        response = client.get("/optional")
+
+        assert response.json() == {"context": None}
+
+    def test_invalid_token_on_optional_route_has_no_user(self, client):
+        """Test that a rejected token leaves the context empty."""
+        response = client.get("/optional", headers={"Authorization": "Bearer not-a-jwt"})
+
+        assert response.json() == {"context": None}
+
+    def test_outside_request_returns_none(self):
+        """Test that code outside a request sees no user."""
+        assert get_current_user_sync() is None
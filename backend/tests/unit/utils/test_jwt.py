@@ -0,0 +1,137 @@
+"""Tests for JWT token utilities."""
+
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from src.models.config import SecurityConfig
+from src.utils.jwt import (
+    InvalidTokenError,
+    JWTManager,
+    TokenExpiredError,
+    TokenType,
+)
+
+
+def make_manager(**security) -> JWTManager:
+    """Create a JWTManager with the given security settings."""
+    config = MagicMock()
+    config.security = SecurityConfig(**{"secret_key": "test-secret-key", **security})
+    with patch("src.utils.jwt.get_config", return_value=config):
+        return JWTManager()
+
+
+def private_key_pem(private_key) -> str:
+    """Serialize a private key as unencrypted PKCS#8 PEM."""
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode()
+
+
+@pytest.fixture
+def jwt_manager() -> JWTManager:
+    """Create an HS256 JWTManager for testing."""
+    return make_manager()
+
+
+class TestValidateTokenCache:
+    """Test that cached payloads are still checked on every validation."""
+
+    def test_repeat_validation_skips_decode(self, jwt_manager):
+        """Test that a validated token is served from the payload cache."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+        jwt_manager.validate_token(token)
+
+        with patch.object(jwt_manager._jwt, "decode") as decode:
+            payload = jwt_manager.validate_token(token, TokenType.ACCESS)
+
+        decode.assert_not_called()
+        assert payload["sub"] == "user-1"
+
+    def test_expired_token_rejected_on_cache_hit(self, jwt_manager):
+        """Test that a cached payload past its exp claim is rejected."""
+        token = jwt_manager.create_access_token(
+            "user-1", "alice", expires_delta=timedelta(seconds=5)
+        )
+        jwt_manager.validate_token(token)
+
+        later = time.time() + 10
+        with patch("src.utils.jwt.time.time", return_value=later):
+            with pytest.raises(TokenExpiredError):
+                jwt_manager.validate_token(token)
+
+    def test_wrong_type_rejected_on_cache_hit(self, jwt_manager):
+        """Test that the token type is enforced for cached payloads."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+        jwt_manager.validate_token(token, TokenType.ACCESS)
+
+        with patch.object(jwt_manager._jwt, "decode") as decode:
+            with pytest.raises(InvalidTokenError):
+                jwt_manager.validate_token(token, TokenType.REFRESH)
+
+        decode.assert_not_called()
+
+    def test_invalid_token_not_cached(self, jwt_manager):
+        """Test that failed validations leave nothing in the cache."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                jwt_manager.validate_token(tampered)
+        assert len(jwt_manager._payload_cache) == 0
+
+    def test_returned_payload_is_a_copy(self, jwt_manager):
+        """Test that callers cannot alter the cached payload."""
+        token = jwt_manager.create_access_token("user-1", "alice")
+        jwt_manager.validate_token(token)["sub"] = "mallory"
+        assert jwt_manager.validate_token(token)["sub"] == "user-1"
+
+
+class TestAsymmetricAlgorithms:
+    """Test signing and verification with asymmetric keys."""
+
+    def test_eddsa_round_trip(self):
+        """Test that an Ed25519 PEM key signs tokens it can verify."""
+        pem = private_key_pem(ed25519.Ed25519PrivateKey.generate())
+        jwt_manager = make_manager(secret_key=pem, algorithm="EdDSA")
+
+        token = jwt_manager.create_access_token("user-1", "alice")
+        payload = jwt_manager.validate_token(token, TokenType.ACCESS)
+
+        assert payload["sub"] == "user-1"
+        assert payload["username"] == "alice"
+        assert isinstance(jwt_manager._verify_key, ed25519.Ed25519PublicKey)
+
+    def test_eddsa_rejects_token_from_other_key(self):
+        """Test that a token signed with a different Ed25519 key fails verification."""
+        signer = make_manager(
+            secret_key=private_key_pem(ed25519.Ed25519PrivateKey.generate()),
+            algorithm="EdDSA"
+        )
+        verifier = make_manager(
+            secret_key=private_key_pem(ed25519.Ed25519PrivateKey.generate()),
+            algorithm="EdDSA"
+        )
+
+        with pytest.raises(InvalidTokenError):
+            verifier.validate_token(signer.create_access_token("user-1", "alice"))
+
+    def test_rs256_logs_recommendation(self):
+        """Test that configuring RS256 logs a warning suggesting EdDSA."""
+        pem = private_key_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+        logger = MagicMock()
+
+        with patch("src.utils.jwt.get_logger", return_value=logger):
+            make_manager(secret_key=pem, algorithm="RS256")
+
+        logger.warning.assert_called_once()
+        message = logger.warning.call_args.args[0]
+        assert "RS256" in message and "EdDSA" in message
+
@@ -3,8 +3,8 @@
 import json
 import logging
 import os
-from io import StringIO
-from unittest.mock import patch
+from io import BytesIO, StringIO, TextIOWrapper
+from unittest.mock import MagicMock, patch
 
 import pytest
 import structlog
@@ -96,9 +96,7 @@ class TestAPILogging:
 
     def test_log_api_request_basic(self):
         """Test logging API request with basic info."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._API_REQUEST_LOGGER') as mock_logger:
             log_api_request(
                 method="GET",
                 path="/api/pr/123/summary",
@@ -114,9 +112,7 @@ class TestAPILogging:
 
     def test_log_api_request_with_body(self):
         """Test logging API request with request body."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._API_REQUEST_LOGGER') as mock_logger:
             request_body = {"pr_number": 123, "repository": "test/repo"}
             
             log_api_request(
@@ -132,9 +128,7 @@ class TestAPILogging:
 
     def test_log_api_response_success(self):
         """Test logging successful API response."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._API_RESPONSE_LOGGER') as mock_logger:
             log_api_response(
                 status_code=200,
                 path="/api/pr/123/summary",
@@ -151,9 +145,7 @@ class TestAPILogging:
 
     def test_log_api_response_error(self):
         """Test logging error API response."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._API_RESPONSE_LOGGER') as mock_logger:
             log_api_response(
                 status_code=500,
                 path="/api/pr/123/summary",
@@ -173,8 +165,8 @@ class TestExternalServiceLogging:
 
     def test_log_external_service_call_success(self):
         """Test logging successful external service call."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
+        with patch.dict('src.utils.logger._EXTERNAL_SERVICE_LOGGERS', {"github": MagicMock()}) as loggers:
+            mock_logger = loggers["github"]
             
             log_external_service_call(
                 service="github",
@@ -194,8 +186,8 @@ class TestExternalServiceLogging:
 
     def test_log_external_service_call_error(self):
         """Test logging failed external service call."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
+        with patch.dict('src.utils.logger._EXTERNAL_SERVICE_LOGGERS', {"gemini": MagicMock()}) as loggers:
+            mock_logger = loggers["gemini"]
             
             log_external_service_call(
                 service="gemini",
@@ -214,8 +206,8 @@ class TestExternalServiceLogging:
 
     def test_log_external_service_call_with_response(self):
         """Test logging external service call with response data."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
+        with patch.dict('src.utils.logger._EXTERNAL_SERVICE_LOGGERS', {"github": MagicMock()}) as loggers:
+            mock_logger = loggers["github"]
             
             response_data = {"pr_count": 5, "files_changed": 3}
             
@@ -238,9 +230,7 @@ class TestPerformanceLogging:
 
     def test_log_performance_metric_basic(self):
         """Test logging basic performance metric."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._PERFORMANCE_LOGGER') as mock_logger:
             log_performance_metric(
                 operation="pr_summary_generation",
                 duration_ms=1500.0,
@@ -256,9 +246,7 @@ class TestPerformanceLogging:
 
     def test_log_performance_metric_with_metadata(self):
         """Test logging performance metric with additional metadata."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._PERFORMANCE_LOGGER') as mock_logger:
             metadata = {
                 "pr_number": 123,
                 "repository": "test/repo",
@@ -279,9 +267,7 @@ class TestPerformanceLogging:
 
     def test_log_performance_metric_failure(self):
         """Test logging performance metric for failed operation."""
-        with patch('structlog.get_logger') as mock_get_logger:
-            mock_logger = mock_get_logger.return_value
-            
+        with patch('src.utils.logger._PERFORMANCE_LOGGER') as mock_logger:
             log_performance_metric(
                 operation="external_api_call",
                 duration_ms=5000.0,
@@ -339,6 +325,40 @@ class TestJSONLogging:
                     # Some implementations might not output to stdout directly
                     pass
 
+    def test_json_log_keeps_order_with_other_stdout_writes(self):
+        """Test that JSON events and plain stdout text come out in the order written."""
+        # Block-buffered like stdout piped to a file or container log
+        stdout = TextIOWrapper(BytesIO(), encoding="utf-8")
+        with patch('sys.stdout', stdout):
+            configure_logging(json_format=True, level=LogLevel.INFO)
+
+            logger = get_logger("test_json_order")
+            logger.info("first", request_id="req-1")
+            print("second")
+            logger.warning("third")
+
+            stdout.flush()
+            lines = stdout.buffer.getvalue().decode().splitlines()
+
+        assert lines[1] == "second"
+        first, third = json.loads(lines[0]), json.loads(lines[2])
+        assert first["event"] == "first"
+        assert first["request_id"] == "req-1"
+        assert first["level"] == "info"
+        assert isinstance(first["timestamp"], int)
+        assert third["event"] == "third"
+        assert third["level"] == "warning"
+
+    def test_json_log_follows_stdout_redirection(self):
+        """Test that loggers created after stdout is replaced write to the replacement."""
+        with patch('sys.stdout', TextIOWrapper(BytesIO(), encoding="utf-8")):
+            configure_logging(json_format=True, level=LogLevel.INFO)
+
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            get_logger("test_json_redirect").info("redirected")
+
+        assert json.loads(mock_stdout.getvalue())["event"] == "redirected"
+
 
 class TestCorrelationID:
     """Test correlation ID functionality."""